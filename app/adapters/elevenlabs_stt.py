@@ -109,10 +109,9 @@ class ElevenLabsSTTAdapter(STTAdapter):
         if 'words' in result:
             for word_info in result['words']:
                 timestamps.append(TimestampInfo(
-                    word=word_info.get('word', ''),
-                    start_time=word_info.get('start', 0.0),
-                    end_time=word_info.get('end', 0.0),
-                    confidence=word_info.get('confidence', 0.9)
+                    start=word_info.get('start', 0.0),
+                    end=word_info.get('end', 0.0),
+                    text=word_info.get('word', '')
                 ))
         
         return timestamps
@@ -2,24 +2,84 @@
 ElevenLabs Text-to-Speech Adapter
 """
 
+import asyncio
+import heapq
 import httpx
+import itertools
 import logging
+import random
+from contextlib import asynccontextmanager
 from typing import Optional, Dict, Any, List
 import base64
 import re
 import io
 
 from app.core.config import settings
+from app.core.http import get_http_client
+from app.core.cache import make_cache_key, tts_cache
 from app.models.tts import TTSResult, TTSOptions
 from app.adapters.base import TTSAdapter
 
 logger = logging.getLogger(__name__)
 
+# Request priorities - lower is served first
+INTERACTIVE_PRIORITY = 0
+BULK_PRIORITY = 1
+
+
+class PrioritySemaphore:
+    """
+    Semaphore that hands free slots to the lowest-priority-value waiter
+    
+    Waiters with equal priority are served in arrival order.
+    """
+    
+    def __init__(self, value: int):
+        self._value = value
+        self._waiters: List[tuple] = []  # heap of (priority, seq, future)
+        self._seq = itertools.count()
+    
+    async def acquire(self, priority: int):
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+        
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # A slot handed over just before cancellation must be passed on
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+    
+    def release(self):
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+    
+    @asynccontextmanager
+    async def slot(self, priority: int):
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+# Shared across adapter instances so the provider's concurrency cap holds process-wide
+_synthesis_slots = PrioritySemaphore(settings.ELEVENLABS_MAX_CONCURRENCY)
+
 
 class ElevenLabsTTSAdapter(TTSAdapter):
     """ElevenLabs TTS adapter"""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        self.http_client = http_client or get_http_client()
         self.api_key = settings.ELEVENLABS_API_KEY
         self.base_url = "https://api.elevenlabs.io/v1"
         
@@ -45,14 +105,31 @@ class ElevenLabsTTSAdapter(TTSAdapter):
                 "speed": options.speed
             })
             
-            # Handle long texts by chunking
-            if len(text) > 2500:  # ElevenLabs actual limit is ~5000 chars, use 2500 for safety
-                return await self._synthesize_long_text(text, language, options)
-            
             # Get voice ID for language
             voice_id = options.voice_id or self._get_default_voice_id(language)
             model = options.model or settings.ELEVENLABS_TTS_MODEL
             
+            # Serve repeated requests from the cache
+            cache_key = make_cache_key("elevenlabs", text, language, voice_id, model, options.speed)
+            cached_audio = await tts_cache.get(cache_key)
+            if cached_audio:
+                logger.info("ElevenLabs TTS cache hit", extra={
+                    "audio_size": len(cached_audio),
+                    "voice_id": voice_id
+                })
+                return TTSResult(
+                    audio_data=cached_audio,
+                    audio_format="mp3",
+                    duration_sec=None,
+                    provider="elevenlabs"
+                )
+            
+            # Handle long texts by chunking
+            if len(text) > 2500:  # ElevenLabs actual limit is ~5000 chars, use 2500 for safety
+                result = await self._synthesize_long_text(text, language, options)
+                await tts_cache.set(cache_key, result.audio_data)
+                return result
+            
             # Prepare request
             url = f"{self.base_url}/text-to-speech/{voice_id}"
             
@@ -77,34 +154,34 @@ class ElevenLabsTTSAdapter(TTSAdapter):
             if options.speed != 1.0:
                 data["voice_settings"]["speed"] = options.speed
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=data, headers=headers)
-                
-                if not response.is_success:
-                    error_text = response.text
-                    logger.error(f"ElevenLabs TTS API error: {response.status_code} - {error_text}")
-                    raise Exception(f"ElevenLabs TTS API error: {response.status_code} - {error_text}")
-                
-                audio_data = response.content
-                
-                if not audio_data:
-                    raise Exception("No audio data returned from ElevenLabs TTS")
-                
-                result = TTSResult(
-                    audio_data=audio_data,
-                    audio_format="mp3",
-                    duration_sec=None,  # ElevenLabs doesn't provide duration
-                    provider="elevenlabs"
-                )
-                
-                logger.info("ElevenLabs TTS synthesis completed", extra={
-                    "audio_size": len(audio_data),
-                    "voice_id": voice_id,
-                    "model": model
-                })
-                
-                return result
-                
+            response = await self._post_with_retry(url, data, headers, INTERACTIVE_PRIORITY)
+            
+            if not response.is_success:
+                error_text = response.text
+                logger.error(f"ElevenLabs TTS API error: {response.status_code} - {error_text}")
+                raise Exception(f"ElevenLabs TTS API error: {response.status_code} - {error_text}")
+            
+            audio_data = response.content
+            
+            if not audio_data:
+                raise Exception("No audio data returned from ElevenLabs TTS")
+            
+            result = TTSResult(
+                audio_data=audio_data,
+                audio_format="mp3",
+                duration_sec=None,  # ElevenLabs doesn't provide duration
+                provider="elevenlabs"
+            )
+            
+            logger.info("ElevenLabs TTS synthesis completed", extra={
+                "audio_size": len(audio_data),
+                "voice_id": voice_id,
+                "model": model
+            })
+            
+            await tts_cache.set(cache_key, audio_data)
+            return result
+            
         except Exception as error:
             logger.error(f"ElevenLabs TTS synthesis failed: {str(error)}")
             
@@ -239,25 +316,49 @@ class ElevenLabsTTSAdapter(TTSAdapter):
         if options.speed != 1.0:
             data["voice_settings"]["speed"] = options.speed
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, json=data, headers=headers)
-            
-            if not response.is_success:
-                error_text = response.text
-                logger.error(f"ElevenLabs TTS API error: {response.status_code} - {error_text}")
-                raise Exception(f"ElevenLabs TTS API error: {response.status_code} - {error_text}")
-            
-            audio_data = response.content
-            
-            if not audio_data:
-                raise Exception("No audio data returned from ElevenLabs TTS")
-            
-            return TTSResult(
-                audio_data=audio_data,
-                audio_format="mp3",
-                duration_sec=None,
-                provider="elevenlabs"
-            )
+        # Long-text chunks queue behind interactive requests between chunks
+        response = await self._post_with_retry(url, data, headers, BULK_PRIORITY)
+        
+        if not response.is_success:
+            error_text = response.text
+            logger.error(f"ElevenLabs TTS API error: {response.status_code} - {error_text}")
+            raise Exception(f"ElevenLabs TTS API error: {response.status_code} - {error_text}")
+        
+        audio_data = response.content
+        
+        if not audio_data:
+            raise Exception("No audio data returned from ElevenLabs TTS")
+        
+        return TTSResult(
+            audio_data=audio_data,
+            audio_format="mp3",
+            duration_sec=None,
+            provider="elevenlabs"
+        )
+    
+    async def _post_with_retry(self, url: str, data: Dict[str, Any], headers: Dict[str, str], priority: int) -> httpx.Response:
+        """
+        POST a synthesis request, bounded by the shared concurrency limit
+        
+        When the limit is reached, waiting requests are admitted by priority.
+        429 responses are retried after Retry-After (or exponential backoff
+        with jitter) instead of failing the request outright.
+        """
+        async with _synthesis_slots.slot(priority):
+            for attempt in range(settings.ELEVENLABS_MAX_RETRIES + 1):
+                response = await self.http_client.post(url, json=data, headers=headers)
+                
+                if response.status_code != 429 or attempt == settings.ELEVENLABS_MAX_RETRIES:
+                    return response
+                
+                retry_after = response.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = float(retry_after)
+                else:
+                    delay = min(8.0, 0.5 * 2 ** attempt) * random.uniform(0.5, 1.0)
+                
+                logger.warning(f"ElevenLabs rate limited, retrying in {delay:.2f}s (attempt {attempt + 1})")
+                await asyncio.sleep(delay)
     
     def _concatenate_audio_chunks(self, audio_chunks: List[bytes]) -> bytes:
         """
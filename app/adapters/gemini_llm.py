@@ -3,25 +3,60 @@ Google Gemini LLM Adapter
 """
 
 import logging
-import google.generativeai as genai
-from typing import List, Dict, Any, Optional
+import re
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 
-from app.core.config import settings
+from app.core.cache import make_cache_key, llm_cache
+from app.core.gemini import GEMINI_MODEL_NAME, get_gemini_model
 from app.models.llm import LLMResult, ConversationMessage
 from app.adapters.base import LLMAdapter
 
 logger = logging.getLogger(__name__)
 
+# Instruction patterns that might leak into LLM output, removed in order
+_CLEANUP_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r"you are.*?doctor.*?patient",
+        r"respond.*?like.*?doctor",
+        r"use tamil.*?english",
+        r"examples?:",
+        r"patient:",
+        r"you:",
+        r"dr\.?\s*tamil:",
+        r"assistant:",
+        r"respond only with",
+        r"output only",
+        r"translation:",
+        r"tamil translation:",
+        r"here.*?translation",
+        r"the translation is",
+    )
+]
+
+# Lines containing any of these look like instructions or examples
+_INSTRUCTION_LINE_RE = re.compile(
+    "|".join(re.escape(indicator) for indicator in (
+        'respond', 'use tamil', 'use english', 'examples', 'guidelines', 
+        'style', 'avoid', 'personality', 'role', 'conversation', 'language mixing'
+    )),
+    re.IGNORECASE
+)
+
+# Earlier turns sent with each prompt; the last RECENT_MESSAGES always go in full
+PROMPT_HISTORY_MESSAGES = 10
+RECENT_MESSAGES = 4
+# Past this many characters of earlier turns, older doctor replies are left out
+HISTORY_CHAR_BUDGET = 3000
+
 
 class GeminiLLMAdapter(LLMAdapter):
     """Google Gemini LLM adapter"""
     
     def __init__(self):
-        genai.configure(api_key=settings.GOOGLE_API_KEY)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        self.model = get_gemini_model()
         self.conversation_history = []
         
-    async def chat(self, user_message: str, language: str = "auto", conversation_history: Optional[List[ConversationMessage]] = None, should_summarize: bool = False) -> str:
+    async def chat(self, user_message: str, language: str = "auto", conversation_history: Optional[List[ConversationMessage]] = None, should_summarize: bool = False, use_cache: bool = False) -> str:
         """
         Generate chat response using Google Gemini
         
@@ -29,6 +64,7 @@ class GeminiLLMAdapter(LLMAdapter):
             user_message: User's message
             language: Detected language
             conversation_history: Previous conversation messages
+            use_cache: Reuse a stored reply for the exact same prompt and history
             
         Returns:
             AI response text
@@ -56,10 +92,9 @@ class GeminiLLMAdapter(LLMAdapter):
             # Build conversation context
             conversation_text = system_prompt + "\n\n"
             
-            if self.conversation_history:
-                for msg in self.conversation_history[-10:]:  # Keep last 10 messages
-                    role = "Human" if msg["role"] == "user" else "Assistant"
-                    conversation_text += f"{role}: {msg['content']}\n"
+            for msg in self._prompt_history():
+                role = "Human" if msg["role"] == "user" else "Assistant"
+                conversation_text += f"{role}: {msg['content']}\n"
             
             conversation_text += f"Human: {user_message}\nAssistant:"
             
@@ -89,30 +124,48 @@ class GeminiLLMAdapter(LLMAdapter):
                     
                     return closure_message
             
-            # Generate response
-            response = self.model.generate_content(conversation_text)
+            # The prompt already carries the system prompt, language and history,
+            # so identical prompts can share a reply
+            cache_key = None
+            ai_response = None
+            if use_cache:
+                cache_key = make_cache_key("gemini", GEMINI_MODEL_NAME, conversation_text)
+                cached_response = await llm_cache.get(cache_key)
+                if cached_response:
+                    logger.info("LLM response cache hit")
+                    ai_response = cached_response.decode("utf-8")
             
-            if response.text:
-                ai_response = response.text.strip()
+            if ai_response is None:
+                # Generate response
+                response = await self.model.generate_content_async(conversation_text)
                 
-                # Clean the response to remove any leaked instructions
-                ai_response = self._clean_llm_output(ai_response)
+                if not response.text:
+                    raise Exception("No response generated from Gemini")
                 
-                # Limit questions to maximum 2 per response
-                ai_response = self._limit_questions(ai_response)
-                
-                # Add AI response to conversation history
-                self.conversation_history.append({
-                    "role": "assistant",
-                    "content": ai_response
-                })
+                ai_response = response.text.strip()
                 
-                logger.info("Gemini chat completed", extra={
-                    "response_length": len(ai_response)
-                })
-                return ai_response
-            else:
-                raise Exception("No response generated from Gemini")
+                # Store the raw completion; the cleanup below runs on every read,
+                # so changes to it also apply to cached replies
+                if cache_key:
+                    await llm_cache.set(cache_key, ai_response.encode("utf-8"))
+            
+            # Clean the response to remove any leaked instructions
+            ai_response = self._clean_llm_output(ai_response)
+            
+            # Limit questions to maximum 2 per response
+            ai_response = self._limit_questions(ai_response)
+            
+            # Add AI response to conversation history
+            self.conversation_history.append({
+                "role": "assistant",
+                "content": ai_response
+            })
+            
+            logger.info("Gemini chat completed", extra={
+                "response_length": len(ai_response)
+            })
+            
+            return ai_response
                 
         except Exception as error:
             logger.error(f"Gemini chat failed: {str(error)}")
@@ -123,6 +176,43 @@ class GeminiLLMAdapter(LLMAdapter):
             else:
                 return "Sorry, I'm having trouble responding right now. Please try again."
     
+    async def chat_turns(self, messages: List[str], language: str = "auto", summarize_from: Optional[int] = None, use_cache: bool = False) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Play a scripted sequence of user turns through this conversation
+        
+        Each turn depends on the history left by the previous one, so turns run
+        in order over the shared model; replies are yielded as they arrive.
+        
+        Args:
+            messages: User messages, one per turn
+            language: Detected language
+            summarize_from: 1-based turn from which summary/closure is allowed
+            use_cache: Reuse stored replies for identical prompts and history
+            
+        Yields:
+            (1-based turn number, AI response text) for each turn
+        """
+        for turn, message in enumerate(messages, 1):
+            should_summarize = summarize_from is not None and turn >= summarize_from
+            yield turn, await self.chat(message, language, should_summarize=should_summarize, use_cache=use_cache)
+    
+    def _prompt_history(self) -> List[Dict[str, str]]:
+        """
+        Earlier turns to send with the current message
+        
+        The current message (last in the history) is added by the caller. Once
+        the earlier turns outgrow HISTORY_CHAR_BUDGET, doctor replies older than
+        the recent exchanges are dropped; what the patient said is always kept
+        so the doctor does not ask again.
+        """
+        previous = self.conversation_history[:-1][-PROMPT_HISTORY_MESSAGES:]
+        if sum(len(msg["content"]) for msg in previous) <= HISTORY_CHAR_BUDGET:
+            return previous
+        
+        older = previous[:-RECENT_MESSAGES]
+        recent = previous[-RECENT_MESSAGES:]
+        return [msg for msg in older if msg["role"] == "user"] + recent
+    
     def _create_system_prompt(self, language: str) -> str:
         """Create system prompt based on detected language"""
         return """You are a caring junior doctor doing pre-screening for patients. You speak naturally in Tamil mixed with English medical terms. Your role is to systematically gather information, comfort patients, and prepare a summary for the senior doctor.
@@ -203,7 +293,7 @@ Create a summary in this format:
 Keep it professional and concise."""
 
         try:
-            response = self.model.generate_content(summary_prompt)
+            response = await self.model.generate_content_async(summary_prompt)
             if response.text:
                 return response.text.strip()
             else:
@@ -216,31 +306,11 @@ Keep it professional and concise."""
         """
         Clean LLM output to remove any leaked instructions or meta-text
         """
-        import re
-        
-        # Remove instruction patterns that might leak
-        cleanup_patterns = [
-            r"you are.*?doctor.*?patient",
-            r"respond.*?like.*?doctor",
-            r"use tamil.*?english",
-            r"examples?:",
-            r"patient:",
-            r"you:",
-            r"dr\.?\s*tamil:",
-            r"assistant:",
-            r"respond only with",
-            r"output only",
-            r"translation:",
-            r"tamil translation:",
-            r"here.*?translation",
-            r"the translation is",
-        ]
-        
         cleaned_text = text
         
         # Remove patterns case-insensitively
-        for pattern in cleanup_patterns:
-            cleaned_text = re.sub(pattern, "", cleaned_text, flags=re.IGNORECASE)
+        for pattern in _CLEANUP_PATTERNS:
+            cleaned_text = pattern.sub("", cleaned_text)
         
         # Remove any lines that start with instruction-like text
         lines = cleaned_text.split('\n')
@@ -252,16 +322,7 @@ Keep it professional and concise."""
                 continue
                 
             # Skip lines that look like instructions or examples
-            skip_line = False
-            instruction_indicators = [
-                'respond', 'use tamil', 'use english', 'examples', 'guidelines', 
-                'style', 'avoid', 'personality', 'role', 'conversation', 'language mixing'
-            ]
-            
-            for indicator in instruction_indicators:
-                if indicator in line.lower():
-                    skip_line = True
-                    break
+            skip_line = _INSTRUCTION_LINE_RE.search(line) is not None
             
             # Skip lines that start with formatting characters
             if line.startswith(('*', '-', '•', '1.', '2.', '3.')):
@@ -285,8 +346,6 @@ Keep it professional and concise."""
         """
         Limit questions to maximum 2 per response
         """
-        import re
-        
         # Split by sentence endings but preserve the original structure
         parts = re.split(r'([.!।])', text)
         
@@ -2,22 +2,27 @@
 Gemini Translation Adapter for Colloquial Tamil
 """
 
+import asyncio
 import logging
-import google.generativeai as genai
-from typing import Optional
+from typing import List, Optional
 
-from app.core.config import settings
+import orjson
+
+from app.core.gemini import get_gemini_model
+from app.core.cache import make_cache_key, translation_cache
 from app.models.translation import TranslationResult
 
 logger = logging.getLogger(__name__)
 
+# Tamil Unicode block (U+0B80-U+0BFF)
+TAMIL_CHARS = frozenset(chr(code) for code in range(0x0B80, 0x0C00))
+
 
 class GeminiTranslateAdapter:
     """Gemini-based translation adapter for colloquial Tamil"""
     
     def __init__(self):
-        genai.configure(api_key=settings.GOOGLE_API_KEY)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        self.model = get_gemini_model()
         
     async def translate_to_colloquial_tamil(self, english_text: str) -> str:
         """
@@ -34,6 +39,12 @@ class GeminiTranslateAdapter:
                 "text_length": len(english_text)
             })
             
+            cache_key = make_cache_key("gemini", english_text, "ta")
+            cached_text = await translation_cache.get(cache_key)
+            if cached_text:
+                logger.info("Gemini colloquial translation cache hit")
+                return cached_text.decode("utf-8")
+            
             prompt = f"""You are a caring junior doctor translating for a patient. Translate this to natural, colloquial Tamil with a respectful and comforting tone.
 
 Guidelines:
@@ -49,7 +60,7 @@ Text to translate: "{english_text}"
 
 Provide only the Tamil translation with caring doctor tone:"""
 
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(prompt)
             
             if response.text:
                 tamil_text = response.text.strip()
@@ -62,6 +73,7 @@ Provide only the Tamil translation with caring doctor tone:"""
                     "translated_length": len(tamil_text)
                 })
                 
+                await translation_cache.set(cache_key, tamil_text.encode("utf-8"))
                 return tamil_text
             else:
                 raise Exception("No translation generated from Gemini")
@@ -71,6 +83,83 @@ Provide only the Tamil translation with caring doctor tone:"""
             # Fallback to original text if translation fails
             return english_text
     
+    async def translate_batch(self, texts: List[str], target_language: str, source_language: Optional[str] = None) -> List[str]:
+        """
+        Translate many texts to colloquial Tamil with a single Gemini request
+        
+        Cached texts are served from the translation cache; the rest go out in
+        one prompt that asks for a JSON array back. If the reply can't be
+        matched up with the inputs, each text is translated on its own.
+        
+        Args:
+            texts: English texts to translate
+            target_language: Target language code (only 'ta' is translated)
+            source_language: Unused, kept for parity with GoogleTranslateAdapter
+        
+        Returns:
+            Translated texts, in the same order as the input
+        """
+        if target_language != "ta" or not texts:
+            return list(texts)
+        
+        # Batch-prompt output is kept apart from translate_to_colloquial_tamil's entries
+        cache_keys = [make_cache_key("gemini-batch", text, "ta") for text in texts]
+        cached = await asyncio.gather(*(translation_cache.get(key) for key in cache_keys))
+        translated = [entry.decode("utf-8") if entry else None for entry in cached]
+        
+        missing = [i for i, entry in enumerate(translated) if entry is None]
+        if not missing:
+            return translated
+        
+        logger.info("Starting Gemini batch colloquial Tamil translation", extra={
+            "count": len(texts),
+            "uncached": len(missing)
+        })
+        
+        numbered = "\n".join(f"{n}. {texts[i]}" for n, i in enumerate(missing, 1))
+        prompt = f"""You are a caring junior doctor translating for a patient. Translate each numbered text below to natural, colloquial Tamil with a respectful and comforting tone.
+
+Guidelines:
+- Keep English medical terms as they are: fever, medicine, blood pressure, diabetes, etc.
+- Use Tamil script for Tamil words: வணக்கம், எப்படி, இருக்கு, சாப்பிடு
+- Mix naturally like real Tamil doctors: "Medicine சாப்ட்டு rest எடுங்க"
+- Be respectful and comforting in tone
+- For questions: sound caring and gentle
+- For long explanations: be detailed but warm and reassuring
+- Maintain the same meaning but make it sound like a caring doctor
+
+Texts to translate:
+{numbered}
+
+Respond with only a JSON array of {len(missing)} strings, the Tamil translations in the same order:"""
+        
+        batch = None
+        try:
+            response = await self.model.generate_content_async(prompt)
+            reply = response.text.strip().removeprefix("```json").strip("`\n ")
+            batch = orjson.loads(reply)
+        except Exception as error:
+            logger.warning(f"Gemini batch translation failed: {str(error)}")
+        
+        if not isinstance(batch, list) or len(batch) != len(missing):
+            # Fall back to one request per text
+            results = await asyncio.gather(*(self.translate_to_colloquial_tamil(texts[i]) for i in missing))
+        else:
+            results = [self._clean_translation_output(str(text).strip()) for text in batch]
+            await asyncio.gather(*(
+                translation_cache.set(cache_keys[i], text.encode("utf-8"))
+                for i, text in zip(missing, results)
+            ))
+        
+        for i, text in zip(missing, results):
+            translated[i] = text
+        
+        logger.info("Gemini batch colloquial translation completed", extra={
+            "count": len(translated)
+        })
+        
+        return translated
+    
     async def translate(self, text: str, target_language: str, source_language: str = "auto") -> TranslationResult:
         """
         Generic translation method for compatibility
@@ -93,7 +182,7 @@ Provide only the Tamil translation with caring doctor tone:"""
         Simple language detection
         """
         # Simple heuristic - if contains Tamil script, it's Tamil
-        if any('\u0b80' <= char <= '\u0bff' for char in text):
+        if not TAMIL_CHARS.isdisjoint(text):
             return "ta"
         else:
             return "en"
@@ -3,23 +3,39 @@ Google Cloud Speech-to-Text Adapter
 """
 
 import logging
+import msgspec
 import time
 from typing import Optional, List, Dict, Any
 from google.cloud import speech
 import io
 
 from app.core.config import settings
+from app.core.cache import make_audio_cache_key, stt_cache
+from app.core.gcp import get_google_credentials
 from app.models.stt import STTResult, STTOptions, TimestampInfo
 from app.adapters.base import STTAdapter
 
 logger = logging.getLogger(__name__)
 
+_client: Optional[speech.SpeechClient] = None
+
+
+def get_speech_client() -> speech.SpeechClient:
+    """Get the process-wide Speech client, creating it on first use"""
+    global _client
+    
+    # Client construction resolves credentials and builds the transport
+    if _client is None:
+        _client = speech.SpeechClient(credentials=get_google_credentials())
+    
+    return _client
+
 
 class GoogleSTTAdapter(STTAdapter):
     """Google Cloud STT adapter"""
     
     def __init__(self):
-        self.client = speech.SpeechClient()
+        self.client = get_speech_client()
         self.project_id = settings.GOOGLE_PROJECT_ID
         
     async def transcribe(self, audio_data: bytes, options: STTOptions) -> STTResult:
@@ -41,6 +57,13 @@ class GoogleSTTAdapter(STTAdapter):
                 "timestamps": options.timestamps
             })
             
+            # Identical audio with identical options gives the same transcript
+            cache_key = make_audio_cache_key("google", audio_data, options.language, options.timestamps, options.max_alternatives)
+            cached_result = await stt_cache.get(cache_key)
+            if cached_result:
+                logger.info("Google STT cache hit")
+                return msgspec.json.decode(cached_result, type=STTResult)
+            
             # Simple validation - just check if we have audio data
             if len(audio_data) < 10:
                 logger.info("No speech detected in audio, returning empty result")
@@ -48,8 +71,7 @@ class GoogleSTTAdapter(STTAdapter):
                     text="",
                     confidence=0.0,
                     detected_language=options.language or "en",
-                    provider="google",
-                    processing_time=time.time() - start_time
+                    provider="google"
                 )
             
             # Use automatic encoding detection - let Google handle it
@@ -74,8 +96,7 @@ class GoogleSTTAdapter(STTAdapter):
                     text="",
                     confidence=0.0,
                     detected_language=options.language or "en",
-                    provider="google",
-                    processing_time=time.time() - start_time
+                    provider="google"
                 )
             
             # Get best result
@@ -113,9 +134,11 @@ class GoogleSTTAdapter(STTAdapter):
                 "detected_language": detected_language,
                 "text_length": len(stt_result.text),
                 "confidence": stt_result.confidence,
-                "has_timestamps": bool(timestamps)
+                "has_timestamps": bool(timestamps),
+                "processing_time": round(time.time() - start_time, 3)
             })
             
+            await stt_cache.set(cache_key, msgspec.json.encode(stt_result))
             return stt_result
             
         except Exception as error:
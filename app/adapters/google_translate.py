@@ -3,21 +3,38 @@ Google Cloud Translation Adapter
 """
 
 import logging
-from typing import Optional
+from typing import List, Optional
 from google.cloud import translate_v2 as translate
 
 from app.core.config import settings
+from app.core.gcp import get_google_credentials
 from app.models.translation import TranslationResult, LanguageDetectionResult
 from app.adapters.base import TranslationAdapter
 
 logger = logging.getLogger(__name__)
 
+_client: Optional[translate.Client] = None
+
+
+def get_translate_client() -> translate.Client:
+    """Get the process-wide Translation client, creating it on first use"""
+    global _client
+    
+    # Client construction resolves credentials and builds the transport
+    if _client is None:
+        _client = translate.Client(credentials=get_google_credentials())
+    
+    return _client
+
 
 class GoogleTranslateAdapter(TranslationAdapter):
     """Google Cloud Translation adapter"""
     
+    # Maximum number of strings Translation v2 accepts per request
+    BATCH_SIZE = 128
+    
     def __init__(self):
-        self.client = translate.Client()
+        self.client = get_translate_client()
         self.project_id = settings.GOOGLE_TRANSLATE_PROJECT_ID
     
     async def translate(self, text: str, target_language: str, source_language: str = "auto") -> TranslationResult:
@@ -175,6 +192,46 @@ class GoogleTranslateAdapter(TranslationAdapter):
             # Return original text if translation fails
             return text
     
+    async def translate_batch(self, texts: List[str], target_language: str, source_language: Optional[str] = None) -> List[str]:
+        """
+        Translate many texts with one request per BATCH_SIZE strings
+        
+        Args:
+            texts: Texts to translate
+            target_language: Target language code (e.g., 'ta', 'en')
+            source_language: Source language code (optional, will auto-detect if not provided)
+        
+        Returns:
+            Translated texts, in the same order as the input
+        """
+        if not texts:
+            return []
+        
+        logger.info("Starting batch translation", extra={
+            "count": len(texts),
+            "target": target_language
+        })
+        
+        source_code = self._map_language_code(source_language) if source_language else None
+        target_code = self._map_language_code(target_language)
+        
+        translated = []
+        for start in range(0, len(texts), self.BATCH_SIZE):
+            # The client sends a list as repeated q params in a single request
+            results = self.client.translate(
+                texts[start:start + self.BATCH_SIZE],
+                target_language=target_code,
+                source_language=source_code,
+                format_="text"
+            )
+            translated.extend(result['translatedText'] for result in results)
+        
+        logger.info("Batch translation completed", extra={
+            "count": len(translated)
+        })
+        
+        return translated
+    
     async def translate_to_tamil(self, text: str, source_language: Optional[str] = None) -> TranslationResult:
         """Convenience method to translate to Tamil"""
         return await self.translate(text, "ta", source_language)
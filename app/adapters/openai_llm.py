@@ -3,19 +3,29 @@ OpenAI LLM Adapter for Conversational AI
 Handles Tamil/English mixed conversations with cultural context
 """
 
+import asyncio
+import httpx
 import openai
 import logging
 from typing import List, Dict, Any, Optional
 from app.core.config import settings
+from app.core.openai_client import get_openai_client
 
 logger = logging.getLogger(__name__)
 
+# Shared across adapter instances; the SDK itself retries 429s with backoff
+_completion_semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+
 
 class OpenAILLMAdapter:
     """OpenAI LLM adapter for conversational AI"""
     
-    def __init__(self):
-        self.client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        # Sessions create an adapter each, so share the client unless one is injected
+        if http_client is not None:
+            self.client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY, http_client=http_client)
+        else:
+            self.client = get_openai_client()
         self.model = "gpt-4o-mini"
         self.conversation_history = []
         
@@ -63,14 +73,15 @@ class OpenAILLMAdapter:
                 "history_length": len(self.conversation_history)
             })
             
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=500,
-                temperature=0.7,
-                presence_penalty=0.1,
-                frequency_penalty=0.1
-            )
+            async with _completion_semaphore:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=500,
+                    temperature=0.7,
+                    presence_penalty=0.1,
+                    frequency_penalty=0.1
+                )
             
             ai_response = response.choices[0].message.content.strip()
             
@@ -5,11 +5,14 @@ Optimized for Indian languages and code-switching
 
 import httpx
 import logging
-from typing import Optional, Dict, Any, List
+import msgspec
+from typing import Optional, Dict, List
 from io import BytesIO
 
 from app.core.config import settings
-from app.models.stt import STTResult, STTOptions
+from app.core.cache import make_audio_cache_key, stt_cache
+from app.core.http import get_http_client
+from app.models.stt import STTResult, STTOptions, TimestampInfo
 from app.adapters.base import STTAdapter
 
 logger = logging.getLogger(__name__)
@@ -18,7 +21,8 @@ logger = logging.getLogger(__name__)
 class SarvamSTTAdapter(STTAdapter):
     """Sarvam AI STT adapter for Indian languages"""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        self.http_client = http_client or get_http_client()
         self.api_key = settings.SARVAM_API_KEY
         self.base_url = "https://api.sarvam.ai/speech-to-text/transcribe"
         
@@ -43,6 +47,13 @@ class SarvamSTTAdapter(STTAdapter):
                 "timestamps": options.timestamps
             })
             
+            # Identical audio with identical options gives the same transcript
+            cache_key = make_audio_cache_key("sarvam", audio_data, options.language, options.timestamps, options.max_alternatives)
+            cached_result = await stt_cache.get(cache_key)
+            if cached_result:
+                logger.info("Sarvam STT cache hit")
+                return msgspec.json.decode(cached_result, type=STTResult)
+            
             # Prepare form data
             files = {
                 "file": ("audio.wav", BytesIO(audio_data), "audio/wav")
@@ -60,44 +71,44 @@ class SarvamSTTAdapter(STTAdapter):
                 "Authorization": f"Bearer {self.api_key}"
             }
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self.base_url,
-                    files=files,
-                    data=data,
-                    headers=headers
-                )
-                
-                if not response.is_success:
-                    error_text = response.text
-                    logger.error(f"Sarvam STT API error: {response.status_code} - {error_text}")
-                    raise Exception(f"Sarvam STT API error: {response.status_code} - {error_text}")
-                
-                result = response.json()
-                
-                if not result.get("transcript"):
-                    raise Exception("No transcript returned from Sarvam STT")
-                
-                # Map response to STTResult
-                detected_language = self._map_sarvam_language_to_standard(
-                    result.get("language_code")
-                )
-                
-                stt_result = STTResult(
-                    text=result["transcript"],
-                    confidence=0.9,  # Sarvam doesn't provide confidence scores
-                    detected_language=detected_language,
-                    timestamps=self._parse_timestamps(result.get("timestamps")) if options.timestamps else None
-                )
-                
-                logger.info("Sarvam STT transcription completed", extra={
-                    "detected_language": detected_language,
-                    "text_length": len(stt_result.text),
-                    "has_timestamps": bool(stt_result.timestamps)
-                })
-                
-                return stt_result
-                
+            response = await self.http_client.post(
+                self.base_url,
+                files=files,
+                data=data,
+                headers=headers
+            )
+            
+            if not response.is_success:
+                error_text = response.text
+                logger.error(f"Sarvam STT API error: {response.status_code} - {error_text}")
+                raise Exception(f"Sarvam STT API error: {response.status_code} - {error_text}")
+            
+            result = response.json()
+            
+            if not result.get("transcript"):
+                raise Exception("No transcript returned from Sarvam STT")
+            
+            # Map response to STTResult
+            detected_language = self._map_sarvam_language_to_standard(
+                result.get("language_code")
+            )
+            
+            stt_result = STTResult(
+                text=result["transcript"],
+                confidence=0.9,  # Sarvam doesn't provide confidence scores
+                detected_language=detected_language,
+                timestamps=self._parse_timestamps(result.get("timestamps")) if options.timestamps else None
+            )
+            
+            logger.info("Sarvam STT transcription completed", extra={
+                "detected_language": detected_language,
+                "text_length": len(stt_result.text),
+                "has_timestamps": bool(stt_result.timestamps)
+            })
+            
+            await stt_cache.set(cache_key, msgspec.json.encode(stt_result))
+            return stt_result
+            
         except Exception as error:
             logger.error(f"Sarvam STT transcription failed: {str(error)}")
             raise Exception(f"Sarvam speech-to-text failed: {str(error)}")
@@ -133,16 +144,16 @@ class SarvamSTTAdapter(STTAdapter):
         
         return "en"  # Default to English
     
-    def _parse_timestamps(self, timestamps_data: Optional[List[Dict]]) -> Optional[List[Dict[str, Any]]]:
+    def _parse_timestamps(self, timestamps_data: Optional[List[Dict]]) -> Optional[List[TimestampInfo]]:
         """Parse timestamps from Sarvam response"""
         if not timestamps_data:
             return None
         
         return [
-            {
-                "start": ts.get("start", 0),
-                "end": ts.get("end", 0),
-                "text": ts.get("text", "")
-            }
+            TimestampInfo(
+                start=ts.get("start", 0),
+                end=ts.get("end", 0),
+                text=ts.get("text", "")
+            )
             for ts in timestamps_data
         ]
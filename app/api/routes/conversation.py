@@ -5,6 +5,7 @@ Real-time conversation API routes
 import logging
 import time
 import base64
+import msgspec
 from typing import Optional
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Depends
 from fastapi.responses import StreamingResponse
@@ -184,7 +185,7 @@ async def listen_endpoint(
             confidence=stt_result.confidence,
             processing_time_sec=round(processing_time, 3),
             stt_provider=actual_provider,
-            timestamps=stt_result.timestamps if timestamps else None
+            timestamps=msgspec.to_builtins(stt_result.timestamps) if timestamps and stt_result.timestamps else None
         )
         
         logger.info("Listen request completed", extra={
@@ -15,6 +15,7 @@ import io
 from app.models.conversation import ConversationRequest, ConversationResponse
 from app.adapters.sarvam_stt import SarvamSTTAdapter
 from app.adapters.google_stt import GoogleSTTAdapter
+from app.adapters.elevenlabs_stt import ElevenLabsSTTAdapter
 from app.adapters.openai_llm import OpenAILLMAdapter
 from app.adapters.gemini_llm import GeminiLLMAdapter
 from app.adapters.elevenlabs_tts import ElevenLabsTTSAdapter
@@ -51,22 +52,92 @@ async def vaanga_pesalam_endpoint(
     4. Return: Audio response for continuous conversation
     """
     start_time = time.time()
+    audio_data_b64 = request.audio_data
+    
+    # Get audio data from base64
+    if audio_data_b64:
+        try:
+            audio_data = base64.b64decode(audio_data_b64)
+            logger.info(f"Processing base64 audio", extra={
+                "base64_length": len(audio_data_b64),
+                "decoded_size": len(audio_data)
+            })
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Invalid base64 audio data: {str(e)}")
+    else:
+        raise HTTPException(status_code=400, detail="No audio data provided")
+    
+    return await _process_conversation(
+        audio_data,
+        start_time=start_time,
+        session_id=request.session_id,
+        reset_conversation=request.reset_conversation or False,
+        stt_provider=request.stt_provider or "google",
+        llm_provider=request.llm_provider or "gemini",
+        tts_provider=request.tts_provider or "elevenlabs",
+        voice_speed=getattr(request, 'voice_speed', 1.0)
+    )
+
+
+@router.post("/vaanga-pesalam/upload")
+async def vaanga_pesalam_upload_endpoint(
+    audio: UploadFile = File(...),
+    session_id: Optional[str] = Form(None),
+    stt_provider: str = Form("sarvam"),
+    tts_provider: str = Form("elevenlabs"),
+    llm_provider: str = Form("gemini"),
+    reset_conversation: bool = Form(False),
+    voice_speed: float = Form(1.0, ge=0.5, le=2.0)
+):
+    """
+    Vaanga Pesalam - multipart/form-data variant
+    
+    Same flow as /vaanga-pesalam, but the audio is uploaded as a raw file
+    so it skips the base64 encode/decode round-trip and its 33% size overhead.
+    """
+    start_time = time.time()
+    
+    audio_data = await audio.read()
+    if not audio_data:
+        raise HTTPException(status_code=400, detail="No audio data provided")
+    
+    logger.info("Processing uploaded audio file", extra={
+        "audio_filename": audio.filename,
+        "audio_size": len(audio_data),
+        "content_type": audio.content_type
+    })
+    
+    return await _process_conversation(
+        audio_data,
+        start_time=start_time,
+        session_id=session_id,
+        reset_conversation=reset_conversation,
+        stt_provider=stt_provider,
+        llm_provider=llm_provider,
+        tts_provider=tts_provider,
+        voice_speed=voice_speed
+    )
+
+
+async def _process_conversation(
+    audio_data: bytes,
+    start_time: float,
+    session_id: Optional[str],
+    reset_conversation: bool,
+    stt_provider: str,
+    llm_provider: str,
+    tts_provider: str,
+    voice_speed: float
+):
+    """Run the STT -> LLM -> TTS pipeline and stream back the audio reply"""
+    llm_adapter = None
     
     try:
-        # Extract variables from request
-        session_id = request.session_id
-        reset_conversation = request.reset_conversation or False
-        stt_provider = request.stt_provider or "google"
-        llm_provider = request.llm_provider or "gemini"
-        tts_provider = request.tts_provider or "elevenlabs"
-        voice_speed = getattr(request, 'voice_speed', 1.0)
-        audio_data_b64 = request.audio_data
-        
         logger.info("Processing Vaanga Pesalam conversation", extra={
             "session_id": session_id,
             "reset_conversation": reset_conversation,
             "stt_provider": stt_provider,
-            "has_audio_data": bool(audio_data_b64)
+            "has_audio_data": bool(audio_data)
         })
         
         # Generate or use existing session ID
@@ -89,19 +160,6 @@ async def vaanga_pesalam_endpoint(
         
         llm_adapter = conversation_sessions[session_id]
         
-        # Get audio data from base64
-        if audio_data_b64:
-            try:
-                audio_data = base64.b64decode(audio_data_b64)
-                logger.info(f"Processing base64 audio", extra={
-                    "base64_length": len(audio_data_b64),
-                    "decoded_size": len(audio_data)
-                })
-            except Exception as e:
-                raise HTTPException(status_code=400, detail=f"Invalid base64 audio data: {str(e)}")
-        else:
-            raise HTTPException(status_code=400, detail="No audio data provided")
-        
         # Step 1: Transcribe audio using selected STT provider
         stt_provider_name = stt_provider
         stt_options = STTOptions(
@@ -0,0 +1,188 @@
+"""
+Two-tier (memory + disk) content cache for provider responses
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(*parts) -> str:
+    """Build a SHA-256 cache key from normalized input parts"""
+    normalized = "|".join(" ".join(str(part).split()) for part in parts)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def make_audio_cache_key(provider: str, audio_data: bytes, *parts) -> str:
+    """Build a cache key from the SHA-256 of raw audio bytes plus request parts"""
+    return make_cache_key(provider, hashlib.sha256(audio_data).hexdigest(), *parts)
+
+
+class ContentCache:
+    """
+    Byte-bounded LRU cache kept in memory and mirrored to disk
+    
+    Each entry is stored as {key}{suffix} under {CACHE_DIR}/{namespace}.
+    Both tiers evict least-recently-used entries once over their size limit.
+    With persist=False only the memory tier is used.
+    """
+    
+    def __init__(self, namespace: str, suffix: str, max_disk_bytes: int, max_memory_bytes: int, persist: bool = True):
+        self.enabled = settings.CACHE_ENABLED
+        self.persist = persist
+        self.directory = Path(settings.CACHE_DIR) / namespace
+        self.suffix = suffix
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+        
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: "OrderedDict[str, int]" = OrderedDict()  # {key: file size}
+        self._disk_bytes = 0
+        self._disk_loaded = False
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return cached content for key, or None on a miss"""
+        if not self.enabled:
+            return None
+        
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            return data
+        
+        if not self.persist:
+            return None
+        
+        self._load_disk_index()
+        if key not in self._disk:
+            return None
+        
+        try:
+            data = await asyncio.to_thread(self._path(key).read_bytes)
+        except OSError:
+            self._forget_disk_entry(key)
+            return None
+        
+        self._disk.move_to_end(key)
+        self._remember(key, data)
+        return data
+    
+    async def set(self, key: str, data: bytes):
+        """Store content for key in memory and on disk"""
+        if not self.enabled or not data:
+            return
+        
+        self._remember(key, data)
+        if not self.persist:
+            return
+        
+        self._load_disk_index()
+        
+        try:
+            await asyncio.to_thread(self._write_file, key, data)
+        except OSError as error:
+            logger.warning(f"Failed to write cache entry: {str(error)}")
+            return
+        
+        self._forget_disk_entry(key)
+        self._disk[key] = len(data)
+        self._disk_bytes += len(data)
+        
+        # Evict least recently used files
+        while self._disk_bytes > self.max_disk_bytes and len(self._disk) > 1:
+            oldest_key = next(iter(self._disk))
+            self._forget_disk_entry(oldest_key)
+            try:
+                self._path(oldest_key).unlink()
+            except OSError:
+                pass
+    
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.suffix}"
+    
+    def _write_file(self, key: str, data: bytes):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write then rename so readers never see a partial file
+        tmp_path = self.directory / f"{key}.tmp"
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self._path(key))
+    
+    def _remember(self, key: str, data: bytes):
+        """Add to the in-memory tier, evicting least recently used entries"""
+        if len(data) > self.max_memory_bytes:
+            return
+        
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+    
+    def _forget_disk_entry(self, key: str):
+        size = self._disk.pop(key, None)
+        if size is not None:
+            self._disk_bytes -= size
+    
+    def _load_disk_index(self):
+        """Index existing cache files once, oldest first"""
+        if self._disk_loaded:
+            return
+        self._disk_loaded = True
+        
+        if not self.directory.is_dir():
+            return
+        
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(self.suffix):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[:-len(self.suffix)], stat.st_size))
+        
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+
+
+# Synthesized audio, keyed by text/language/voice/model/speed
+tts_cache = ContentCache(
+    "tts", ".mp3",
+    max_disk_bytes=settings.TTS_CACHE_MAX_MB * 1024 * 1024,
+    max_memory_bytes=settings.CACHE_MEMORY_MAX_MB * 1024 * 1024
+)
+
+# Translated text, keyed by provider/text/target language
+translation_cache = ContentCache(
+    "translation", ".txt",
+    max_disk_bytes=settings.TRANSLATION_CACHE_MAX_MB * 1024 * 1024,
+    max_memory_bytes=settings.CACHE_MEMORY_MAX_MB * 1024 * 1024
+)
+
+# Transcripts (msgspec JSON), keyed by provider/audio hash/STT options.
+# Patient speech is health data, so it stays in memory unless STT_CACHE_DISK is set
+stt_cache = ContentCache(
+    "stt", ".json",
+    max_disk_bytes=settings.STT_CACHE_MAX_MB * 1024 * 1024,
+    max_memory_bytes=settings.CACHE_MEMORY_MAX_MB * 1024 * 1024,
+    persist=settings.STT_CACHE_DISK
+)
+
+# Opted-in LLM replies, keyed by provider/model and message or full prompt
+llm_cache = ContentCache(
+    "llm", ".txt",
+    max_disk_bytes=settings.LLM_CACHE_MAX_MB * 1024 * 1024,
+    max_memory_bytes=settings.CACHE_MEMORY_MAX_MB * 1024 * 1024
+)
@@ -2,6 +2,7 @@
 Configuration management using Pydantic settings
 """
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from typing import Optional
@@ -51,6 +52,24 @@ class Settings(BaseSettings):
     # Sarvam AI Configuration
     SARVAM_API_KEY: Optional[str] = Field(default=None, description="Sarvam AI API key")
     
+    # Build provider clients and open connections at startup so the first request skips the setup cost
+    PREWARM_CONNECTIONS: bool = Field(default=True, description="Pre-build provider clients and warm HTTP connections on startup")
+    
+    # Client-side concurrency limits for provider APIs
+    ELEVENLABS_MAX_CONCURRENCY: int = Field(default=2, description="Max concurrent ElevenLabs TTS requests")
+    ELEVENLABS_MAX_RETRIES: int = Field(default=4, description="Retries on ElevenLabs 429 responses")
+    OPENAI_MAX_CONCURRENCY: int = Field(default=4, description="Max concurrent OpenAI requests")
+    
+    # Response Caching
+    CACHE_ENABLED: bool = Field(default=True, description="Cache TTS audio, transcripts, translations and opted-in LLM replies")
+    CACHE_DIR: str = Field(default=".cache", description="Directory for on-disk caches")
+    CACHE_MEMORY_MAX_MB: int = Field(default=32, description="In-memory size limit per cache")
+    TTS_CACHE_MAX_MB: int = Field(default=500, description="On-disk size limit for cached TTS audio")
+    TRANSLATION_CACHE_MAX_MB: int = Field(default=50, description="On-disk size limit for cached translations")
+    STT_CACHE_DISK: bool = Field(default=False, description="Also write cached transcripts to disk (they contain patient speech)")
+    STT_CACHE_MAX_MB: int = Field(default=50, description="On-disk size limit for cached transcripts")
+    LLM_CACHE_MAX_MB: int = Field(default=10, description="On-disk size limit for cached LLM replies")
+    
     # Default Providers
     DEFAULT_STT_PROVIDER: str = Field(default="sarvam", description="Default STT provider")
     DEFAULT_TTS_PROVIDER: str = Field(default="elevenlabs", description="Default TTS provider")
@@ -58,6 +77,9 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATE_LIMIT_REQUESTS: int = Field(default=100, description="Rate limit requests per window")
     RATE_LIMIT_WINDOW: int = Field(default=60, description="Rate limit window in seconds")
+    REDIS_URL: Optional[str] = Field(default=None, description="Redis URL for rate limits shared across workers")
+    RATE_LIMIT_FLUSH_EVERY: int = Field(default=10, description="Local requests batched per Redis rate limit update")
+    REDIS_TIMEOUT: float = Field(default=0.5, description="Seconds to wait on Redis before allowing the request anyway")
     
     # Logging
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
@@ -69,8 +91,13 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse the environment once; later calls return the same instance"""
+    return Settings()
+
 # Create settings instance
-settings = Settings()
+settings = get_settings()
 
 # Validate required settings
 def validate_settings():
@@ -0,0 +1,28 @@
+"""
+Shared Google Cloud credentials for the Google SDK clients
+"""
+
+from typing import Optional
+
+import google.auth
+from google.auth.credentials import Credentials
+
+# Covers both Speech-to-Text and Translation
+CLOUD_PLATFORM_SCOPE = "https://www.googleapis.com/auth/cloud-platform"
+
+_credentials: Optional[Credentials] = None
+
+
+def get_google_credentials() -> Credentials:
+    """
+    Get the process-wide Google credentials, resolving them on first use
+    
+    The credentials are scoped up front so every client uses this one object
+    instead of a scoped copy, sharing a single OAuth access token.
+    """
+    global _credentials
+    
+    if _credentials is None:
+        _credentials, _ = google.auth.default(scopes=[CLOUD_PLATFORM_SCOPE])
+    
+    return _credentials
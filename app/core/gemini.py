@@ -0,0 +1,29 @@
+"""
+Shared Gemini model for the Gemini adapters
+"""
+
+from typing import Optional
+
+import google.generativeai as genai
+
+from app.core.config import settings
+
+GEMINI_MODEL_NAME = "gemini-1.5-flash"
+
+_model: Optional[genai.GenerativeModel] = None
+
+
+def get_gemini_model() -> genai.GenerativeModel:
+    """
+    Get the process-wide Gemini model, configuring the client on first use
+    
+    The model holds no conversation state, so adapters can share it and keep
+    their own history.
+    """
+    global _model
+    
+    if _model is None:
+        genai.configure(api_key=settings.GOOGLE_API_KEY)
+        _model = genai.GenerativeModel(GEMINI_MODEL_NAME)
+    
+    return _model
@@ -0,0 +1,62 @@
+"""
+Shared HTTP client for outbound provider calls
+"""
+
+import asyncio
+import logging
+from typing import Iterable, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Keep connections to provider APIs alive between requests
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+HTTP_TIMEOUT = httpx.Timeout(30.0)
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled AsyncClient, creating it on first use"""
+    global _shared_client
+    
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=_http2_available(),
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT
+        )
+    
+    return _shared_client
+
+
+async def close_http_client():
+    """Close the shared client and its pooled connections"""
+    global _shared_client
+    
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+async def warm_up_connections(urls: Iterable[str]):
+    """Open pooled connections (DNS + TLS) to provider hosts before the first real call"""
+    client = get_http_client()
+    
+    async def _warm(url: str):
+        try:
+            await client.head(url, timeout=5.0)
+        except httpx.HTTPError as error:
+            logger.warning(f"Connection warm-up failed for {url}: {str(error)}")
+    
+    await asyncio.gather(*(_warm(url) for url in urls))
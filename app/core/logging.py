@@ -13,26 +13,23 @@ from app.core.config import settings
 class JSONFormatter(logging.Formatter):
     """JSON log formatter"""
     
+    # Extra fields copied from the record when present
+    EXTRA_FIELDS = ("request_id", "user_id", "endpoint", "processing_time")
+    
     def format(self, record: logging.LogRecord) -> str:
         log_entry = {
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            # Skip the %-formatting pass when there are no args
+            "message": record.getMessage() if record.args else str(record.msg),
         }
         
         # Add extra fields if present
-        if hasattr(record, 'request_id'):
-            log_entry["request_id"] = record.request_id
-        
-        if hasattr(record, 'user_id'):
-            log_entry["user_id"] = record.user_id
-            
-        if hasattr(record, 'endpoint'):
-            log_entry["endpoint"] = record.endpoint
-            
-        if hasattr(record, 'processing_time'):
-            log_entry["processing_time"] = record.processing_time
+        record_dict = record.__dict__
+        for key in self.EXTRA_FIELDS:
+            if key in record_dict:
+                log_entry[key] = record_dict[key]
         
         # Add exception info if present
         if record.exc_info:
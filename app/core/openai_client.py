@@ -0,0 +1,34 @@
+"""
+Shared OpenAI client for the OpenAI adapter and scripts
+"""
+
+from typing import Optional
+
+import openai
+
+from app.core.config import settings
+from app.core.http import get_http_client
+
+_client: Optional[openai.AsyncOpenAI] = None
+_client_http = None  # the pooled HTTP client _client was built on
+
+
+def get_openai_client() -> openai.AsyncOpenAI:
+    """
+    Get the process-wide OpenAI client, creating it on first use
+    
+    The client wraps the shared pooled HTTP client, so every caller reuses the
+    same keep-alive connections to the API.
+    """
+    global _client, _client_http
+    
+    # Rebuild if the pooled client was closed and replaced (e.g. on shutdown)
+    http_client = get_http_client()
+    if _client is None or _client_http is not http_client:
+        _client = openai.AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=http_client
+        )
+        _client_http = http_client
+    
+    return _client
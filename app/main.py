@@ -7,25 +7,46 @@ from fastapi import FastAPI, Request, Depends, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse, JSONResponse, ORJSONResponse
 import uvicorn
+import asyncio
 import logging
-import time
+import os
 from contextlib import asynccontextmanager
 from typing import Optional, Union
 import io
 
 from app.core.config import settings
 from app.core.logging import setup_logging
+from app.core.http import close_http_client, warm_up_connections
+from app.adapters.google_stt import get_speech_client
+from app.adapters.google_translate import get_translate_client
+from app.core.gemini import get_gemini_model
 from app.api.routes import conversation, health, vaanga_pesalam, auth
 from app.middleware.auth import verify_token
-from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.edge import EdgeMiddleware
+from app.middleware.rate_limit import create_rate_limiter
 
 # Setup logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
 security = HTTPBearer()
+rate_limiter = create_rate_limiter()
+
+
+def preload_provider_clients():
+    """Build SDK clients up front so credential loading never lands on a request"""
+    factories = (
+        ("Google STT", get_speech_client),
+        ("Google Translate", get_translate_client),
+        ("Gemini", get_gemini_model),
+    )
+    for name, factory in factories:
+        try:
+            factory()
+        except Exception as error:
+            logger.warning(f"{name} client preload failed: {str(error)}")
 
 
 @asynccontextmanager
@@ -37,8 +58,37 @@ async def lifespan(app: FastAPI):
     logger.info(f"Default STT: {settings.DEFAULT_STT_PROVIDER}")
     logger.info(f"Default TTS: {settings.DEFAULT_TTS_PROVIDER}")
     
+    if settings.PREWARM_CONNECTIONS and not settings.OFFLINE_MODE:
+        # Warm up provider connections in the background
+        warm_urls = ["https://api.elevenlabs.io/v1/voices"]
+        if settings.SARVAM_API_KEY:
+            warm_urls.append("https://api.sarvam.ai/")
+        if settings.OPENAI_API_KEY:
+            warm_urls.append("https://api.openai.com/v1/models")
+        app.state.connection_warmup = asyncio.create_task(warm_up_connections(warm_urls))
+        
+        # SDK clients are built before the app accepts traffic
+        await asyncio.to_thread(preload_provider_clients)
+    
+    # Build the OpenAPI schema off the event loop so the first /docs hit is fast
+    if settings.DEBUG:
+        app.state.openapi_warmup = asyncio.create_task(asyncio.to_thread(app.openapi))
+    
     yield
     
+    # Stop any warm-up still running, so no task is left pending at exit
+    warmups = [
+        task for task in (
+            getattr(app.state, "connection_warmup", None),
+            getattr(app.state, "openapi_warmup", None)
+        ) if task is not None
+    ]
+    for task in warmups:
+        task.cancel()
+    await asyncio.gather(*warmups, return_exceptions=True)
+    
+    await rate_limiter.close()
+    await close_http_client()
     logger.info("👋 Tamil Voice Gateway shutting down...")
 
 
@@ -49,6 +99,7 @@ app = FastAPI(
     version="2.0.0",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -61,33 +112,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add rate limiting middleware
-app.add_middleware(RateLimitMiddleware)
-
-# Request logging middleware
-@app.middleware("http")
-async def logging_middleware(request: Request, call_next):
-    """Log all requests"""
-    start_time = time.time()
-    
-    logger.info("Request started", extra={
-        "method": request.method,
-        "url": str(request.url),
-        "client_ip": request.client.host if request.client else "unknown"
-    })
-    
-    response = await call_next(request)
-    
-    process_time = time.time() - start_time
-    logger.info("Request completed", extra={
-        "method": request.method,
-        "url": str(request.url),
-        "status_code": response.status_code,
-        "process_time": round(process_time, 3)
-    })
-    
-    response.headers["X-Process-Time"] = str(round(process_time, 3))
-    return response
+# Add rate limiting + request logging middleware
+app.add_middleware(EdgeMiddleware, rate_limiter=rate_limiter)
 
 # Error handling
 @app.exception_handler(Exception)
@@ -108,9 +134,9 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 # Mount static files
-try:
+if os.path.isdir("static"):
     app.mount("/static", StaticFiles(directory="static", html=True), name="static")
-except RuntimeError:
+else:
     # Static directory doesn't exist yet
     logger.warning("Static directory not found, skipping static file mounting")
 
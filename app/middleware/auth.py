@@ -3,7 +3,8 @@ JWT Authentication middleware
 """
 
 import logging
-from typing import Optional
+import time
+from typing import Optional, Tuple
 from fastapi import HTTPException, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
@@ -13,25 +14,37 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 security = HTTPBearer()
 
+# Payload returned while authentication is bypassed
+_BYPASS_USER = {"user_id": "test_user", "bypassed": True}
+
+# Cached (token, expiry) pair from create_test_token()
+_cached_test_token: Optional[Tuple[str, int]] = None
+
 
 async def verify_token(request: Request):
     """Verify JWT token from Authorization header - DISABLED FOR TESTING"""
     # Always bypass authentication for easier testing
-    logger.info("Authentication bypassed - testing mode enabled")
-    return {"user_id": "test_user", "bypassed": True}
+    logger.debug("Authentication bypassed - testing mode enabled")
+    return _BYPASS_USER
 
 
 def create_test_token() -> str:
-    """Create a test JWT token for development"""
-    import time
+    """Create a test JWT token for development (reused until close to expiry)"""
+    global _cached_test_token
+    
+    now = int(time.time())
+    if _cached_test_token and now < _cached_test_token[1] - 60:
+        return _cached_test_token[0]
     
+    expires_at = now + settings.JWT_EXPIRE_MINUTES * 60
     payload = {
         "userId": "test-user-123",
         "email": "test@tamilvoice.com", 
         "name": "Test User",
-        "iat": int(time.time()),
-        "exp": int(time.time()) + settings.JWT_EXPIRE_MINUTES * 60
+        "iat": now,
+        "exp": expires_at
     }
     
     token = jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    _cached_test_token = (token, expires_at)
     return token
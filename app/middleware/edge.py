@@ -0,0 +1,86 @@
+"""
+Edge middleware - rate limiting and request logging in a single ASGI layer
+"""
+
+import logging
+import time
+
+from starlette.datastructures import URL, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Paths exempt from rate limiting
+UNLIMITED_PATH_PREFIXES = ("/health",)
+
+# Paths that are polled frequently and not worth logging
+SILENT_PATH_PREFIXES = ("/health", "/static")
+
+
+class EdgeMiddleware:
+    """Rate limit, time and log every HTTP request with one pass over the scope"""
+    
+    def __init__(self, app: ASGIApp, rate_limiter: RateLimiter):
+        self.app = app
+        self.rate_limiter = rate_limiter
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        path = scope["path"]
+        start_time = time.monotonic_ns()
+        
+        # Rate limit check
+        client_ip = None
+        if not path.startswith(UNLIMITED_PATH_PREFIXES):
+            client_ip = self.rate_limiter.get_client_ip(scope)
+            if not await self.rate_limiter.allow(client_ip, start_time):
+                response = JSONResponse(
+                    status_code=429,
+                    content={"detail": "Rate limit exceeded. Please try again later."},
+                    headers=self.rate_limiter.retry_headers
+                )
+                await response(scope, receive, send)
+                return
+        
+        log_request = not path.startswith(SILENT_PATH_PREFIXES)
+        if not log_request and client_ip is None:
+            await self.app(scope, receive, send)
+            return
+        
+        if log_request:
+            method = scope["method"]
+            url = str(URL(scope=scope))
+            client = scope.get("client")
+            logger.info("Request started", extra={
+                "method": method,
+                "url": url,
+                "client_ip": client[0] if client else "unknown"
+            })
+        
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                
+                # Add rate limit headers
+                if client_ip is not None:
+                    headers.raw.extend(self.rate_limiter.response_headers(client_ip))
+                
+                if log_request:
+                    process_time = round((time.monotonic_ns() - start_time) / 1_000_000_000, 3)
+                    headers["X-Process-Time"] = str(process_time)
+                    logger.info("Request completed", extra={
+                        "method": method,
+                        "url": url,
+                        "status_code": message["status"],
+                        "process_time": process_time
+                    })
+            
+            await send(message)
+        
+        await self.app(scope, receive, send_wrapper)
@@ -1,79 +1,80 @@
 """
-Rate limiting middleware
+Rate limiting
 """
 
+import asyncio
 import logging
 import time
-from typing import Dict, Tuple
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Dict, List, Optional, Tuple
+
+from starlette.types import Scope
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware using in-memory storage"""
+class RateLimiter:
+    """Fixed-window rate limiter using in-memory storage"""
     
-    def __init__(self, app):
-        super().__init__(app)
-        self.requests: Dict[str, Tuple[int, float]] = {}  # {client_ip: (count, window_start)}
+    def __init__(self):
+        self.requests: Dict[str, Tuple[int, int]] = {}  # {client_ip: (count, window_start_ns)}
         self.max_requests = settings.RATE_LIMIT_REQUESTS
         self.window_seconds = settings.RATE_LIMIT_WINDOW
-    
-    async def dispatch(self, request: Request, call_next):
-        """Process request with rate limiting"""
-        
-        # Skip rate limiting for health checks
-        if request.url.path.startswith("/health"):
-            return await call_next(request)
-        
-        # Get client IP
-        client_ip = self._get_client_ip(request)
-        current_time = time.time()
+        self.window_ns = self.window_seconds * 1_000_000_000
         
+        # Values that never change per request
+        self._limit_header = str(self.max_requests).encode("latin-1")
+        self.retry_headers = {"Retry-After": str(self.window_seconds)}
+    
+    async def allow(self, client_ip: str, current_time: int) -> bool:
+        """Record a request for client_ip, returning False if it is over the limit"""
         # Clean up old entries
         self._cleanup_old_entries(current_time)
         
         # Check rate limit
         if self._is_rate_limited(client_ip, current_time):
             logger.warning(f"Rate limit exceeded for {client_ip}")
-            raise HTTPException(
-                status_code=429,
-                detail="Rate limit exceeded. Please try again later.",
-                headers={"Retry-After": str(self.window_seconds)}
-            )
+            return False
         
         # Update request count
         self._update_request_count(client_ip, current_time)
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers
-        remaining = max(0, self.max_requests - self.requests[client_ip][0])
-        response.headers["X-RateLimit-Limit"] = str(self.max_requests)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(int(self.requests[client_ip][1] + self.window_seconds))
-        
-        return response
+        return True
     
-    def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP from request"""
-        # Check for forwarded headers first
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
+    def response_headers(self, client_ip: str) -> List[Tuple[bytes, bytes]]:
+        """Build raw X-RateLimit-* headers for client_ip"""
+        count, window_start = self.requests.get(client_ip, (0, time.monotonic_ns()))
+        remaining = max(0, self.max_requests - count)
+        
+        # Monotonic clock is only converted to wall-clock epoch for the header
+        reset_in_ns = window_start + self.window_ns - time.monotonic_ns()
+        reset = int(time.time() + reset_in_ns / 1_000_000_000)
+        
+        return [
+            (b"x-ratelimit-limit", self._limit_header),
+            (b"x-ratelimit-remaining", str(remaining).encode("latin-1")),
+            (b"x-ratelimit-reset", str(reset).encode("latin-1")),
+        ]
+    
+    def get_client_ip(self, scope: Scope) -> str:
+        """Extract client IP from the raw ASGI scope"""
+        # Check for forwarded headers first, walking the raw header list so
+        # no Headers mapping is built for the request
+        real_ip = None
+        for name, value in scope["headers"]:
+            if name == b"x-forwarded-for" and value:
+                return value.split(b",", 1)[0].strip().decode("latin-1")
+            if name == b"x-real-ip" and value and real_ip is None:
+                real_ip = value
         
-        real_ip = request.headers.get("X-Real-IP")
         if real_ip:
-            return real_ip
+            return real_ip.decode("latin-1")
         
         # Fallback to direct client IP
-        return request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        return client[0] if client else "unknown"
     
-    def _is_rate_limited(self, client_ip: str, current_time: float) -> bool:
+    def _is_rate_limited(self, client_ip: str, current_time: int) -> bool:
         """Check if client is rate limited"""
         if client_ip not in self.requests:
             return False
@@ -81,12 +82,12 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         count, window_start = self.requests[client_ip]
         
         # Check if we're still in the same window
-        if current_time - window_start < self.window_seconds:
+        if current_time - window_start < self.window_ns:
             return count >= self.max_requests
         
         return False
     
-    def _update_request_count(self, client_ip: str, current_time: float):
+    def _update_request_count(self, client_ip: str, current_time: int):
         """Update request count for client"""
         if client_ip not in self.requests:
             self.requests[client_ip] = (1, current_time)
@@ -95,17 +96,135 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         count, window_start = self.requests[client_ip]
         
         # Check if we need to start a new window
-        if current_time - window_start >= self.window_seconds:
+        if current_time - window_start >= self.window_ns:
             self.requests[client_ip] = (1, current_time)
         else:
             self.requests[client_ip] = (count + 1, window_start)
     
-    def _cleanup_old_entries(self, current_time: float):
+    def _cleanup_old_entries(self, current_time: int):
         """Remove old entries to prevent memory leaks"""
         expired_ips = [
             ip for ip, (_, window_start) in self.requests.items()
-            if current_time - window_start > self.window_seconds * 2
+            if current_time - window_start > self.window_ns * 2
         ]
         
         for ip in expired_ips:
             del self.requests[ip]
+    
+    async def close(self):
+        """Release any external resources"""
+        pass
+
+
+class RedisRateLimiter(RateLimiter):
+    """
+    Fixed-window rate limiter with canonical counts in Redis
+    
+    The in-memory counter acts as an admission filter: while a client is
+    well under the limit in this worker, requests are counted locally and
+    flushed to Redis in batches. Once the local count passes half the limit
+    every request is checked against the shared Redis count.
+    
+    Redis calls are bounded by REDIS_TIMEOUT. On a failure the limiter falls
+    back to local counting for a short while, keeping unsent counts for the
+    next flush.
+    """
+    
+    # How long to skip Redis after a failed or timed-out update
+    FAILURE_BACKOFF_NS = 5 * 1_000_000_000
+    
+    # INCRBY the window key and set its TTL when the key is first created
+    INCR_SCRIPT = """
+local current = redis.call('INCRBY', KEYS[1], ARGV[1])
+if current == tonumber(ARGV[1]) then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return current
+"""
+    
+    def __init__(self, redis_url: str):
+        import redis.asyncio as redis
+        from redis.exceptions import TimeoutError as RedisTimeoutError
+        
+        super().__init__()
+        self.redis = redis.from_url(
+            redis_url,
+            socket_timeout=settings.REDIS_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_TIMEOUT
+        )
+        self._timeout_errors = (RedisTimeoutError, asyncio.TimeoutError)
+        self._redis_retry_at = 0  # monotonic ns; Redis is skipped until then
+        self._incr = self.redis.register_script(self.INCR_SCRIPT)
+        self.local_threshold = self.max_requests // 2
+        self.flush_every = max(1, settings.RATE_LIMIT_FLUSH_EVERY)
+        self.pending: Dict[str, int] = {}  # {client_ip: requests not yet sent to Redis}
+    
+    async def allow(self, client_ip: str, current_time: int) -> bool:
+        """Record a request for client_ip, returning False if it is over the limit"""
+        # This worker alone has used up the limit
+        if not await super().allow(client_ip, current_time):
+            return False
+        
+        count = self.requests[client_ip][0]
+        pending = 1 if count == 1 else self.pending.get(client_ip, 0) + 1
+        
+        # Fast path: well under the limit, batch the update
+        if count < self.local_threshold and pending < self.flush_every:
+            self.pending[client_ip] = pending
+            return True
+        
+        self.pending[client_ip] = 0
+        total = await self._flush(client_ip, pending)
+        if total is None:
+            # Fail open, keeping the unsent count for the next flush
+            self.pending[client_ip] = self.pending.get(client_ip, 0) + pending
+            return True
+        
+        if total > self.max_requests:
+            logger.warning(f"Rate limit exceeded for {client_ip} (shared)")
+            return False
+        
+        return True
+    
+    async def close(self):
+        """Close the Redis connection pool"""
+        await self.redis.aclose()
+    
+    async def _flush(self, client_ip: str, amount: int) -> Optional[int]:
+        """Add amount to the shared window count, returning the new total"""
+        # Windows are aligned on wall-clock time so all workers share a key
+        window_index = int(time.time()) // self.window_seconds
+        key = f"ratelimit:{client_ip}:{window_index}"
+        
+        # Redis failed recently; stay on the local count until the backoff ends
+        if time.monotonic_ns() < self._redis_retry_at:
+            return None
+        
+        try:
+            return int(await self._incr(keys=[key], args=[amount, self.window_seconds]))
+        except self._timeout_errors:
+            logger.warning("Redis rate limit update timed out, allowing request")
+        except Exception as error:
+            logger.warning(f"Redis rate limit update failed: {str(error)}")
+        
+        # Fail open on the local count while Redis is unavailable
+        self._redis_retry_at = time.monotonic_ns() + self.FAILURE_BACKOFF_NS
+        return None
+    
+    def _cleanup_old_entries(self, current_time: int):
+        """Remove old entries to prevent memory leaks"""
+        super()._cleanup_old_entries(current_time)
+        
+        for ip in [ip for ip in self.pending if ip not in self.requests]:
+            del self.pending[ip]
+
+
+def create_rate_limiter() -> RateLimiter:
+    """Create the Redis-backed limiter when REDIS_URL is set, else in-memory"""
+    if settings.REDIS_URL:
+        try:
+            return RedisRateLimiter(settings.REDIS_URL)
+        except ImportError:
+            logger.warning("redis package not installed, using in-memory rate limiting")
+    
+    return RateLimiter()
@@ -2,7 +2,7 @@
 Large Language Model data models
 """
 
-from pydantic import BaseModel, Field
+import msgspec
 from typing import Optional, List
 from enum import Enum
 
@@ -13,16 +13,16 @@ class LLMProvider(str, Enum):
     GEMINI = "gemini"
 
 
-class ConversationMessage(BaseModel):
+class ConversationMessage(msgspec.Struct, frozen=True):
     """Conversation message"""
-    role: str = Field(description="Message role: user or assistant")
-    content: str = Field(description="Message content")
-    timestamp: Optional[float] = Field(default=None, description="Message timestamp")
+    role: str  # Message role: user or assistant
+    content: str  # Message content
+    timestamp: Optional[float] = None  # Message timestamp
 
 
-class LLMResult(BaseModel):
+class LLMResult(msgspec.Struct, frozen=True):
     """LLM response result"""
-    text: str = Field(description="Generated response text")
-    provider: str = Field(description="LLM provider used")
-    model: str = Field(description="Model used")
-    tokens_used: Optional[int] = Field(default=None, description="Tokens consumed")
+    text: str  # Generated response text
+    provider: str  # LLM provider used
+    model: str  # Model used
+    tokens_used: Optional[int] = None  # Tokens consumed
@@ -2,7 +2,8 @@
 Speech-to-Text data models
 """
 
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
@@ -16,43 +17,52 @@ class STTProvider(str, Enum):
 
 class STTOptions(BaseModel):
     """STT processing options"""
-    language: str = Field(default="auto", description="Language code or 'auto' for detection")
-    timestamps: bool = Field(default=False, description="Include word-level timestamps")
-    max_alternatives: int = Field(default=1, description="Maximum number of alternative transcriptions")
-    provider: STTProvider = Field(default=STTProvider.SARVAM, description="STT provider to use")
+    language: str = "auto"  # Language code or 'auto' for detection
+    timestamps: bool = False  # Include word-level timestamps
+    max_alternatives: int = 1  # Maximum number of alternative transcriptions
+    provider: STTProvider = STTProvider.SARVAM  # STT provider to use
 
 
-class TimestampInfo(BaseModel):
-    """Word-level timestamp information"""
-    start: float = Field(description="Start time in seconds")
-    end: float = Field(description="End time in seconds")
-    text: str = Field(description="Word or phrase text")
+class TimestampInfo(msgspec.Struct, frozen=True):
+    """Word-level timestamp information (internal pipeline)"""
+    start: float  # Start time in seconds
+    end: float  # End time in seconds
+    text: str  # Word or phrase text
 
 
-class STTResult(BaseModel):
-    """STT transcription result"""
-    text: str = Field(description="Transcribed text")
-    confidence: float = Field(description="Confidence score (0.0 to 1.0)")
-    detected_language: str = Field(description="Detected language code")
-    timestamps: Optional[List[TimestampInfo]] = Field(default=None, description="Word-level timestamps")
-    alternatives: Optional[List[str]] = Field(default=None, description="Alternative transcriptions")
-    provider: Optional[str] = Field(default=None, description="STT provider used")
+class STTResult(msgspec.Struct, frozen=True):
+    """STT transcription result (internal pipeline)"""
+    text: str  # Transcribed text
+    confidence: float  # Confidence score (0.0 to 1.0)
+    detected_language: str  # Detected language code
+    timestamps: Optional[List[TimestampInfo]] = None  # Word-level timestamps
+    alternatives: Optional[List[str]] = None  # Alternative transcriptions
+    provider: Optional[str] = None  # STT provider used
+
+
+class WordTimestamp(BaseModel):
+    """Word-level timestamp in API responses"""
+    start: float  # Start time in seconds
+    end: float  # End time in seconds
+    text: str  # Word or phrase text
 
 
 class ListenRequest(BaseModel):
     """Request model for /listen endpoint"""
-    audio_base64: Optional[str] = Field(default=None, description="Base64 encoded audio data")
-    stt_provider: STTProvider = Field(default=STTProvider.SARVAM, description="STT provider preference")
-    timestamps: bool = Field(default=False, description="Include timestamps in response")
+    audio_base64: Optional[str] = None  # Base64 encoded audio data
+    stt_provider: STTProvider = STTProvider.SARVAM  # STT provider preference
+    timestamps: bool = False  # Include timestamps in response
 
 
 class ListenResponse(BaseModel):
     """Response model for /listen endpoint"""
-    success: bool = Field(description="Request success status")
-    english_transcript: str = Field(description="English transcript for conversation")
-    original_language: str = Field(description="Detected original language")
-    original_text: str = Field(description="Original transcribed text")
-    confidence: float = Field(description="Transcription confidence")
-    processing_time_sec: float = Field(description="Processing time in seconds")
-    stt_provider: str = Field(description="STT provider used")
-    timestamps: Optional[List[TimestampInfo]] = Field(default=None, description="Word-level timestamps")
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
+    success: bool  # Request success status
+    english_transcript: str  # English transcript for conversation
+    original_language: str  # Detected original language
+    original_text: str  # Original transcribed text
+    confidence: float  # Transcription confidence
+    processing_time_sec: float  # Processing time in seconds
+    stt_provider: str  # STT provider used
+    timestamps: Optional[List[WordTimestamp]] = None  # Word-level timestamps
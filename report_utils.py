@@ -0,0 +1,22 @@
+"""
+Shared console-report helpers for the test scripts
+"""
+
+import sys
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+
+@contextmanager
+def buffered_output() -> Iterator[Callable[[str], None]]:
+    """
+    Collect a test's report lines and print them as one block on exit
+    
+    Tests that run concurrently report through this, so each test's output
+    stays together instead of interleaving with the others.
+    """
+    lines = []
+    try:
+        yield lines.append
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -3,10 +3,11 @@
 Simple test for Speak module without audio recording dependencies
 """
 
-import requests
+import asyncio
+import httpx
 import json
 
-def test_speak_api():
+async def test_speak_api(client: httpx.AsyncClient):
     """Test Speak API directly"""
     print("Testing Speak API...")
     
@@ -24,32 +25,36 @@ def test_speak_api():
     }
     
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
-        print(f"Status Code: {response.status_code}")
-        print(f"Headers: {dict(response.headers)}")
-        
-        if response.status_code == 200:
-            print(f"✅ SUCCESS: Audio generated ({len(response.content)} bytes)")
+        async with client.stream("POST", url, headers=headers, json=payload, timeout=30) as response:
+            print(f"Status Code: {response.status_code}")
+            print(f"Headers: {dict(response.headers)}")
             
-            # Save the audio file
-            with open("test_speak_output.mp3", "wb") as f:
-                f.write(response.content)
-            print("Audio saved as test_speak_output.mp3")
-            return True
-        else:
-            print(f"❌ FAILED: {response.text}")
-            return False
+            if response.status_code == 200:
+                # Save the audio file as chunks arrive
+                audio_size = 0
+                with open("test_speak_output.mp3", "wb") as f:
+                    async for chunk in response.aiter_bytes(8192):
+                        f.write(chunk)
+                        audio_size += len(chunk)
+                
+                print(f"✅ SUCCESS: Audio generated ({audio_size} bytes)")
+                print("Audio saved as test_speak_output.mp3")
+                return True
+            else:
+                await response.aread()
+                print(f"❌ FAILED: {response.text}")
+                return False
             
     except Exception as e:
         print(f"❌ EXCEPTION: {e}")
         return False
 
-def test_health_api():
+async def test_health_api(client: httpx.AsyncClient):
     """Test health endpoint"""
     print("Testing Health API...")
     
     try:
-        response = requests.get("http://localhost:8005/health", timeout=10)
+        response = await client.get("http://localhost:8005/health", timeout=10)
         print(f"Status Code: {response.status_code}")
         
         if response.status_code == 200:
@@ -63,20 +68,25 @@ def test_health_api():
         print(f"❌ Health check exception: {e}")
         return False
 
-if __name__ == "__main__":
+async def main():
+    """Run health then speak checks over one shared connection"""
     print("=== Tamil Voice Gateway Simple Test ===")
     
-    # Test health first
-    health_ok = test_health_api()
-    print()
-    
-    # Test speak if health is ok
-    if health_ok:
-        speak_ok = test_speak_api()
+    async with httpx.AsyncClient(follow_redirects=True) as client:
+        # Test health first
+        health_ok = await test_health_api(client)
+        print()
         
-        if speak_ok:
-            print("\n✅ All tests passed! The Speak module is working.")
+        # Test speak if health is ok
+        if health_ok:
+            speak_ok = await test_speak_api(client)
+            
+            if speak_ok:
+                print("\n✅ All tests passed! The Speak module is working.")
+            else:
+                print("\n❌ Speak module test failed.")
         else:
-            print("\n❌ Speak module test failed.")
-    else:
-        print("\n❌ Server health check failed.")
+            print("\n❌ Server health check failed.")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -5,36 +5,27 @@ Simple test of the Python Tamil Voice Gateway without external dependencies
 
 import asyncio
 import json
-from pathlib import Path
+import os
+from collections import namedtuple
+
+# Mock results, defined once instead of building a class on every call
+MockSTTResult = namedtuple('MockSTTResult', 'text confidence detected_language timestamps')
+MockTranslationResult = namedtuple('MockTranslationResult', 'text source_language target_language confidence provider')
+MockTTSResult = namedtuple('MockTTSResult', 'audio_data format sample_rate')
 
 # Mock adapters for testing without external APIs
 class MockSarvamSTTAdapter:
     async def transcribe(self, audio_data, options):
-        return type('Result', (), {
-            'text': 'வணக்கம், இது ஒரு சோதனை',
-            'confidence': 0.95,
-            'detected_language': 'ta',
-            'timestamps': None
-        })()
+        return MockSTTResult('வணக்கம், இது ஒரு சோதனை', 0.95, 'ta', None)
 
 class MockGoogleTranslateAdapter:
     async def translate_to_english(self, text, source_language=None):
-        return type('Result', (), {
-            'text': 'Hello, this is a test',
-            'source_language': source_language or 'ta',
-            'target_language': 'en',
-            'confidence': 1.0,
-            'provider': 'google'
-        })()
+        return MockTranslationResult('Hello, this is a test', source_language or 'ta', 'en', 1.0, 'google')
 
 class MockElevenLabsTTSAdapter:
     async def synthesize(self, text, language, options):
         # Return mock audio data
-        return type('Result', (), {
-            'audio_data': b'mock_audio_data_' + text.encode('utf-8')[:50],
-            'format': 'mp3',
-            'sample_rate': 22050
-        })()
+        return MockTTSResult(b'mock_audio_data_' + text.encode('utf-8')[:50], 'mp3', 22050)
 
 async def test_listen_flow():
     """Test the listen flow: Audio -> STT -> Translation"""
@@ -145,10 +136,16 @@ def test_project_structure():
         '.env.example'
     ]
     
-    missing_files = []
-    for file_path in required_files:
-        if not Path(file_path).exists():
-            missing_files.append(file_path)
+    # List each parent directory once instead of a stat per file
+    present = set()
+    for directory in {os.path.dirname(file_path) for file_path in required_files}:
+        try:
+            with os.scandir(directory or ".") as entries:
+                present.update(os.path.join(directory, entry.name) for entry in entries)
+        except FileNotFoundError:
+            pass
+    
+    missing_files = [file_path for file_path in required_files if file_path not in present]
     
     if missing_files:
         print(f"❌ Missing files: {missing_files}")
@@ -3,40 +3,82 @@
 Start script for Tamil Voice Gateway Python server
 """
 
+import importlib.util
 import os
+import shutil
 import sys
 import subprocess
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
+# (distribution name, pip requirement) for the packages the server needs to boot
+CORE_PACKAGES = [
+    ("fastapi", "fastapi"),
+    ("uvicorn", "uvicorn[standard]"),
+    ("python-multipart", "python-multipart"),
+    ("pydantic", "pydantic"),
+    ("pydantic-settings", "pydantic-settings"),
+    ("httpx", "httpx"),
+    ("python-dotenv", "python-dotenv"),
+    ("requests", "requests"),
+    ("aiofiles", "aiofiles"),
+]
+
 def check_requirements():
-    """Check if all requirements are installed"""
-    try:
-        import fastapi
-        import uvicorn
-        import pydantic
-        import httpx
+    """Return pip requirements for core packages that are not installed"""
+    # Read installed package metadata instead of importing each package
+    missing = []
+    for distribution, requirement in CORE_PACKAGES:
+        try:
+            version(distribution)
+        except PackageNotFoundError:
+            missing.append(requirement)
+    
+    if missing:
+        print(f"❌ Missing dependencies: {', '.join(missing)}")
+    else:
         print("✅ Core dependencies available")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependencies: {e}")
-        return False
+    return missing
 
-def install_dependencies():
-    """Install dependencies"""
-    print("📦 Installing dependencies...")
+def install_dependencies(packages=None):
+    """Install only the given (or all core) dependencies"""
+    packages = packages or [requirement for _, requirement in CORE_PACKAGES]
+    print(f"📦 Installing dependencies: {', '.join(packages)}")
+    
+    # uv resolves and installs much faster than pip when available
+    if shutil.which("uv"):
+        command = ["uv", "pip", "install", "--python", sys.executable, *packages]
+    else:
+        command = [sys.executable, "-m", "pip", "install", *packages]
+    
     try:
-        subprocess.run([
-            sys.executable, "-m", "pip", "install", 
-            "fastapi", "uvicorn[standard]", "python-multipart", 
-            "pydantic", "pydantic-settings", "httpx", "python-dotenv",
-            "requests", "aiofiles"
-        ], check=True)
+        subprocess.run(command, check=True)
         print("✅ Core dependencies installed")
         return True
     except subprocess.CalledProcessError:
         print("❌ Failed to install dependencies")
         return False
 
+def server_options():
+    """uvicorn settings - auto-reload only with DEV=1, worker processes otherwise"""
+    dev_mode = os.getenv("DEV") == "1"
+    options = {
+        "host": "0.0.0.0",
+        "port": int(os.getenv("PORT", "8000")),
+        "reload": dev_mode,
+        "log_level": "info",
+        # Prefer the C-implemented uvloop/httptools when installed (uvicorn[standard])
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+    }
+    
+    # uvicorn ignores workers while reloading. Vaanga-pesalam sessions and the
+    # in-memory rate limits live in each process, so extra workers are opt-in
+    if not dev_mode:
+        options["workers"] = int(os.getenv("WORKERS", "1"))
+    
+    return options
+
 def check_env_file():
     """Check if .env file exists"""
     env_file = Path(".env")
@@ -56,24 +98,12 @@ def start_server():
         # Import here to avoid issues if dependencies aren't installed
         import uvicorn
         
-        uvicorn.run(
-            "app.main:app",
-            host="0.0.0.0",
-            port=8000,
-            reload=True,
-            log_level="info"
-        )
+        uvicorn.run("app.main:app", **server_options())
     except ImportError:
         print("❌ FastAPI/Uvicorn not installed. Installing now...")
         if install_dependencies():
             import uvicorn
-            uvicorn.run(
-                "app.main:app",
-                host="0.0.0.0", 
-                port=8000,
-                reload=True,
-                log_level="info"
-            )
+            uvicorn.run("app.main:app", **server_options())
         else:
             print("❌ Failed to start server")
             sys.exit(1)
@@ -91,9 +121,9 @@ def main():
         return
     
     # Check/install dependencies
-    if not check_requirements():
-        if not install_dependencies():
-            return
+    missing = check_requirements()
+    if missing and not install_dependencies(missing):
+        return
     
     # Start server
     print("\n🌐 Server will be available at:")
@@ -396,72 +396,65 @@ async function processVaangaRecording() {
             currentSessionId = 'session_' + Date.now();
         }
 
-        // Convert audio to base64
-        const reader = new FileReader();
-        reader.onloadend = async () => {
-            try {
-                const base64Audio = reader.result.split(',')[1];
+        try {
+            const formData = new FormData();
+            formData.append('audio', audioBlob, 'recording.webm');
+            formData.append('session_id', currentSessionId);
+            formData.append('stt_provider', selectedVaangaSTTProvider || 'google');
+            formData.append('llm_provider', selectedLLMProvider || 'gemini');
+            formData.append('tts_provider', 'elevenlabs');
+            formData.append('voice_speed', '1.0');
+            
+            // Upload raw audio as multipart to skip the base64 round-trip
+            const response = await fetch(`${API_BASE_URL}/v1/vaanga-pesalam/upload`, {
+                method: 'POST',
+                headers: {
+                    'x-skip-auth': 'true'
+                },
+                body: formData
+            });
+
+            if (response.ok) {
+                const errorType = response.headers.get('X-Error-Type');
                 
-                const response = await fetch(`${API_BASE_URL}/v1/vaanga-pesalam`, {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                        'x-skip-auth': 'true'
-                    },
-                    body: JSON.stringify({
-                        audio_data: base64Audio,
-                        session_id: currentSessionId,
-                        stt_provider: selectedVaangaSTTProvider || 'google',
-                        llm_provider: selectedLLMProvider || 'gemini',
-                        tts_provider: 'elevenlabs',
-                        voice_speed: 1.0
-                    })
-                });
-
-                if (response.ok) {
-                    const errorType = response.headers.get('X-Error-Type');
+                if (errorType === 'quota_exceeded') {
+                    // Handle quota exceeded - show text response
+                    const data = await response.json();
+                    const userTranscriptB64 = response.headers.get('X-User-Transcript');
+                    const userTranscript = userTranscriptB64 ? decodeURIComponent(escape(atob(userTranscriptB64))) : '';
                     
-                    if (errorType === 'quota_exceeded') {
-                        // Handle quota exceeded - show text response
-                        const data = await response.json();
-                        const userTranscriptB64 = response.headers.get('X-User-Transcript');
-                        const userTranscript = userTranscriptB64 ? decodeURIComponent(escape(atob(userTranscriptB64))) : '';
-                        
-                        addChatMessage('user', userTranscript);
-                        addChatMessage('ai', data.text_response);
-                        showStatus('vaangaStatus', '⚠️ Voice quota exceeded. Text response shown.', 'warning');
-                    } else {
-                        // Normal audio response
-                        const userTranscriptB64 = response.headers.get('X-User-Transcript');
-                        const aiResponseB64 = response.headers.get('X-AI-Response');
-                        const sessionId = response.headers.get('X-Session-ID');
-                        
-                        const userTranscript = userTranscriptB64 ? decodeURIComponent(escape(atob(userTranscriptB64))) : '';
-                        const aiResponse = aiResponseB64 ? decodeURIComponent(escape(atob(aiResponseB64))) : '';
-                        
-                        // Display conversation in chat
-                        addChatMessage('user', userTranscript);
-                        addChatMessage('ai', aiResponse);
-                        
-                        // Play AI response audio
-                        const audioBlob = await response.blob();
-                        const audioUrl = URL.createObjectURL(audioBlob);
-                        const audio = new Audio(audioUrl);
-                        audio.play();
-                        
-                        showStatus('vaangaStatus', 'Response received! 🎵', 'success');
-                    }
+                    addChatMessage('user', userTranscript);
+                    addChatMessage('ai', data.text_response);
+                    showStatus('vaangaStatus', '⚠️ Voice quota exceeded. Text response shown.', 'warning');
                 } else {
-                    const errorData = await response.json();
-                    showStatus('vaangaStatus', `❌ Error: ${errorData.detail}`, 'error');
+                    // Normal audio response
+                    const userTranscriptB64 = response.headers.get('X-User-Transcript');
+                    const aiResponseB64 = response.headers.get('X-AI-Response');
+                    const sessionId = response.headers.get('X-Session-ID');
+                    
+                    const userTranscript = userTranscriptB64 ? decodeURIComponent(escape(atob(userTranscriptB64))) : '';
+                    const aiResponse = aiResponseB64 ? decodeURIComponent(escape(atob(aiResponseB64))) : '';
+                    
+                    // Display conversation in chat
+                    addChatMessage('user', userTranscript);
+                    addChatMessage('ai', aiResponse);
+                    
+                    // Play AI response audio
+                    const audioBlob = await response.blob();
+                    const audioUrl = URL.createObjectURL(audioBlob);
+                    const audio = new Audio(audioUrl);
+                    audio.play();
+                    
+                    showStatus('vaangaStatus', 'Response received! 🎵', 'success');
                 }
-                
-            } catch (error) {
-                showStatus('vaangaStatus', `❌ Network error: ${error.message}`, 'error');
+            } else {
+                const errorData = await response.json();
+                showStatus('vaangaStatus', `❌ Error: ${errorData.detail}`, 'error');
             }
-        };
-        
-        reader.readAsDataURL(audioBlob);
+            
+        } catch (error) {
+            showStatus('vaangaStatus', `❌ Network error: ${error.message}`, 'error');
+        }
         
     } catch (error) {
         showStatus('vaangaStatus', `❌ Processing error: ${error.message}`, 'error');
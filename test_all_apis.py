@@ -16,75 +16,87 @@ from app.adapters.google_translate import GoogleTranslateAdapter
 from app.adapters.openai_llm import OpenAILLMAdapter
 from app.models.stt import STTOptions, STTProvider
 from app.models.tts import TTSOptions, TTSProvider
+from app.core.cache import stt_cache, tts_cache
 from app.core.config import settings
+from app.core.http import get_http_client, close_http_client
+
+# A probe answered from the cache would report a revoked key or spent quota
+# as working, so every probe must reach its provider
+stt_cache.enabled = False
+tts_cache.enabled = False
+
+# 1KB of silence, shared by the STT probes
+SILENCE_1K = bytes(1024)
+
+async def probe_openai():
+    """Test OpenAI API"""
+    openai_adapter = OpenAILLMAdapter(http_client=get_http_client())
+    response = await openai_adapter.chat("Test message", language="en")
+    return f"{response[:50]}..."
+
+async def probe_sarvam():
+    """Test Sarvam STT API"""
+    sarvam_adapter = SarvamSTTAdapter(http_client=get_http_client())
+    # Create a small test audio (silence)
+    test_audio = SILENCE_1K
+    stt_options = STTOptions(language="auto", provider=STTProvider.SARVAM)
+    response = await sarvam_adapter.transcribe(test_audio, stt_options)
+    return f"Response: {response}"
+
+async def probe_google_stt():
+    """Test Google Cloud STT API"""
+    google_stt_adapter = GoogleSTTAdapter()
+    test_audio = SILENCE_1K
+    stt_options = STTOptions(language="auto", provider=STTProvider.GOOGLE)
+    response = await google_stt_adapter.transcribe(test_audio, stt_options)
+    return f"Response: {response}"
+
+async def probe_elevenlabs():
+    """Test ElevenLabs TTS API"""
+    elevenlabs_adapter = ElevenLabsTTSAdapter(http_client=get_http_client())
+    tts_options = TTSOptions(provider=TTSProvider.ELEVENLABS, speed=1.0)
+    result = await elevenlabs_adapter.synthesize("Test message", "en", tts_options)
+    return f"Generated {len(result.audio_data)} bytes"
+
+async def probe_google_translate():
+    """Test Google Translate API"""
+    translate_adapter = GoogleTranslateAdapter()
+    response = await translate_adapter.translate("Hello world", target_language="ta")
+    return f"{response}"
+
+# (result key, display name, probe)
+PROBES = [
+    ('openai', "OpenAI", probe_openai),
+    ('sarvam', "Sarvam STT", probe_sarvam),
+    ('google_stt', "Google STT", probe_google_stt),
+    ('elevenlabs', "ElevenLabs TTS", probe_elevenlabs),
+    ('google_translate', "Google Translate", probe_google_translate),
+]
 
 async def test_all_apis():
     """Test all API integrations and check quotas"""
     print("🔍 Testing All API Integrations & Quotas")
     print("=" * 60)
     
-    results = {}
-    
-    # 1. Test OpenAI API
-    print("\n🤖 Testing OpenAI API...")
-    try:
-        openai_adapter = OpenAILLMAdapter()
-        response = await openai_adapter.chat("Test message", language="en")
-        print(f"✅ OpenAI: Working - {response[:50]}...")
-        results['openai'] = True
-    except Exception as e:
-        print(f"❌ OpenAI Error: {str(e)}")
-        results['openai'] = False
-    
-    # 2. Test Sarvam STT API
-    print("\n🎤 Testing Sarvam STT API...")
-    try:
-        sarvam_adapter = SarvamSTTAdapter()
-        # Create a small test audio (silence)
-        test_audio = b'\x00' * 1024  # 1KB of silence
-        stt_options = STTOptions(language="auto", provider=STTProvider.SARVAM)
-        response = await sarvam_adapter.transcribe(test_audio, stt_options)
-        print(f"✅ Sarvam STT: Working - Response: {response}")
-        results['sarvam'] = True
-    except Exception as e:
-        print(f"❌ Sarvam STT Error: {str(e)}")
-        results['sarvam'] = False
-    
-    # 3. Test Google Cloud STT API
-    print("\n🎤 Testing Google Cloud STT API...")
+    # Run every probe concurrently; wall-clock is the slowest provider.
+    # HTTP-based adapters share one keep-alive connection pool.
+    print("\n⏳ Probing all providers in parallel...")
     try:
-        google_stt_adapter = GoogleSTTAdapter()
-        test_audio = b'\x00' * 1024  # 1KB of silence
-        stt_options = STTOptions(language="auto", provider=STTProvider.GOOGLE)
-        response = await google_stt_adapter.transcribe(test_audio, stt_options)
-        print(f"✅ Google STT: Working - Response: {response}")
-        results['google_stt'] = True
-    except Exception as e:
-        print(f"❌ Google STT Error: {str(e)}")
-        results['google_stt'] = False
+        outcomes = await asyncio.gather(
+            *(probe() for _, _, probe in PROBES),
+            return_exceptions=True
+        )
+    finally:
+        await close_http_client()
     
-    # 4. Test ElevenLabs TTS API
-    print("\n🔊 Testing ElevenLabs TTS API...")
-    try:
-        elevenlabs_adapter = ElevenLabsTTSAdapter()
-        tts_options = TTSOptions(language="en", provider=TTSProvider.ELEVENLABS, voice_speed=1.0)
-        audio_data = await elevenlabs_adapter.synthesize("Test message", tts_options)
-        print(f"✅ ElevenLabs TTS: Working - Generated {len(audio_data)} bytes")
-        results['elevenlabs'] = True
-    except Exception as e:
-        print(f"❌ ElevenLabs TTS Error: {str(e)}")
-        results['elevenlabs'] = False
-    
-    # 5. Test Google Translate API
-    print("\n🌐 Testing Google Translate API...")
-    try:
-        translate_adapter = GoogleTranslateAdapter()
-        response = await translate_adapter.translate("Hello world", target_language="ta")
-        print(f"✅ Google Translate: Working - {response}")
-        results['google_translate'] = True
-    except Exception as e:
-        print(f"❌ Google Translate Error: {str(e)}")
-        results['google_translate'] = False
+    results = {}
+    for (key, name, _), outcome in zip(PROBES, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"❌ {name} Error: {str(outcome)}")
+            results[key] = False
+        else:
+            print(f"✅ {name}: Working - {outcome}")
+            results[key] = True
     
     # Summary
     print("\n" + "=" * 60)
@@ -5,7 +5,25 @@ Test script to verify clean Tamil output without instruction leakage
 
 import asyncio
 import httpx
-import json
+import orjson
+import re
+
+def _compile_indicators(indicators):
+    """Match any indicator phrase, case-insensitively, in one regex search"""
+    return re.compile('|'.join(re.escape(indicator) for indicator in indicators), re.IGNORECASE)
+
+# Phrases that show prompt instructions leaked into translated speech
+SPEAK_LEAK_RE = _compile_indicators([
+    'translate', 'output', 'respond', 'guidelines', 'style', 
+    'examples', 'avoid', 'use tamil', 'use english', 'doctor would say'
+])
+
+# Phrases that show prompt instructions leaked into doctor chat replies
+CHAT_LEAK_RE = _compile_indicators([
+    'respond', 'use tamil', 'use english', 'examples', 'guidelines',
+    'style', 'avoid', 'personality', 'role', 'conversation', 'language mixing',
+    'translate', 'output only', 'dr. tamil', 'assistant'
+])
 
 async def test_clean_speak_output():
     """Test Speak module for clean Tamil output"""
@@ -22,33 +40,37 @@ async def test_clean_speak_output():
     url = "http://localhost:8005/v1/speak/preview"
     headers = {"Content-Type": "application/json", "x-skip-auth": "true"}
     
-    for i, text in enumerate(test_cases, 1):
-        print(f"\n📝 Test {i}: {text}")
-        
+    async def speak(client: httpx.AsyncClient, text: str) -> httpx.Response:
         payload = {
             "english_text": text,
             "target_language": "ta", 
             "voice_speed": 1.0,
             "voice_provider": "elevenlabs"
         }
+        return await client.post(url, content=orjson.dumps(payload), headers=headers)
+    
+    # Send all cases at once over one client; report in order afterwards
+    async with httpx.AsyncClient(timeout=20.0) as client:
+        responses = await asyncio.gather(
+            *(speak(client, text) for text in test_cases),
+            return_exceptions=True
+        )
+    
+    for i, (text, response) in enumerate(zip(test_cases, responses), 1):
+        print(f"\n📝 Test {i}: {text}")
         
         try:
-            async with httpx.AsyncClient(timeout=20.0) as client:
-                response = await client.post(url, json=payload, headers=headers)
-                
+            if isinstance(response, Exception):
+                raise response
+            
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 tamil_text = result.get('final_text', '')
                 
                 print(f"✅ Tamil: {tamil_text}")
                 
                 # Check for instruction leakage
-                instruction_indicators = [
-                    'translate', 'output', 'respond', 'guidelines', 'style', 
-                    'examples', 'avoid', 'use tamil', 'use english', 'doctor would say'
-                ]
-                
-                has_instructions = any(indicator in tamil_text.lower() for indicator in instruction_indicators)
+                has_instructions = SPEAK_LEAK_RE.search(tamil_text) is not None
                 
                 if has_instructions:
                     print("❌ INSTRUCTION LEAK DETECTED!")
@@ -85,13 +107,7 @@ async def test_clean_vaanga_pesalam():
             print(f"🩺 Doctor: {response}")
             
             # Check for instruction leakage
-            instruction_indicators = [
-                'respond', 'use tamil', 'use english', 'examples', 'guidelines',
-                'style', 'avoid', 'personality', 'role', 'conversation', 'language mixing',
-                'translate', 'output only', 'dr. tamil', 'assistant'
-            ]
-            
-            has_instructions = any(indicator in response.lower() for indicator in instruction_indicators)
+            has_instructions = CHAT_LEAK_RE.search(response) is not None
             
             if has_instructions:
                 print("❌ INSTRUCTION LEAK DETECTED!")
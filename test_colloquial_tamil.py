@@ -5,9 +5,17 @@ Test script for colloquial Tamil output in Speak and Vaanga Pesalam modules
 
 import asyncio
 import httpx
-import json
+import orjson
+import re
 import time
 
+# English medical terms expected in colloquial (Tanglish) speak output
+SPEAK_ENGLISH_RE = re.compile(r'medicine|blood|pressure|check|symptoms', re.IGNORECASE)
+
+# English medical terms and colloquial Tamil markers in doctor chat replies
+CHAT_ENGLISH_RE = re.compile(r'medicine|fever|blood|pressure|check|rest|doctor|symptoms', re.IGNORECASE)
+CHAT_COLLOQUIAL_RE = re.compile(r'ah|ku|la|irukku|vaanga|pannunga|sapdu')
+
 async def test_speak_colloquial_tamil():
     """Test the Speak module with colloquial Tamil translation"""
     print("🧪 Testing Speak Module - Colloquial Tamil Translation")
@@ -26,29 +34,39 @@ async def test_speak_colloquial_tamil():
         "x-skip-auth": "true"
     }
     
-    for i, text in enumerate(test_texts, 1):
-        print(f"\n📝 Test {i}: {text}")
-        
+    async def speak(client: httpx.AsyncClient, text: str) -> httpx.Response:
         payload = {
             "english_text": text,
             "target_language": "ta",
             "voice_speed": 1.0,
             "voice_provider": "elevenlabs"
         }
+        return await client.post(url, content=orjson.dumps(payload), headers=headers)
+    
+    # Send all texts at once over one client (the server caps ElevenLabs
+    # concurrency itself); report in order afterwards
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        responses = await asyncio.gather(
+            *(speak(client, text) for text in test_texts),
+            return_exceptions=True
+        )
+    
+    for i, (text, response) in enumerate(zip(test_texts, responses), 1):
+        print(f"\n📝 Test {i}: {text}")
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=payload, headers=headers)
-                
+            if isinstance(response, Exception):
+                raise response
+            
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 final_text = result.get('final_text', '')
                 
                 print(f"✅ Tamil: {final_text}")
                 print(f"🔊 Audio: {result.get('audio_size_bytes', 0):,} bytes")
                 
                 # Check if it looks colloquial (contains English words mixed in)
-                has_english_words = any(word in final_text.lower() for word in ['medicine', 'blood', 'pressure', 'check', 'symptoms'])
+                has_english_words = SPEAK_ENGLISH_RE.search(final_text) is not None
                 style = "🎯 Colloquial (Tanglish)" if has_english_words else "📚 Formal Tamil"
                 print(f"📋 Style: {style}")
                 
@@ -57,9 +75,6 @@ async def test_speak_colloquial_tamil():
                 
         except Exception as e:
             print(f"❌ Exception: {str(e)}")
-        
-        if i < len(test_texts):
-            await asyncio.sleep(1)
 
 async def test_vaanga_pesalam_colloquial():
     """Test the Vaanga Pesalam module with colloquial Tamil responses"""
@@ -79,6 +94,10 @@ async def test_vaanga_pesalam_colloquial():
         "x-skip-auth": "true"
     }
     
+    # One adapter for every message; each message starts a fresh conversation
+    from app.adapters.gemini_llm import GeminiLLMAdapter
+    gemini_adapter = GeminiLLMAdapter()
+    
     for i, message in enumerate(test_messages, 1):
         print(f"\n👤 Patient: {message}")
         
@@ -94,35 +113,29 @@ async def test_vaanga_pesalam_colloquial():
         }
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # For this test, let's directly call the LLM to see the text response
-                # In practice, this would go through the full conversation flow
-                
-                # Simulate the conversation by calling Gemini directly
-                from app.adapters.gemini_llm import GeminiLLMAdapter
-                
-                gemini_adapter = GeminiLLMAdapter()
-                response_text = await gemini_adapter.chat(message, "en")
-                
-                print(f"🩺 Doctor: {response_text}")
-                
-                # Check if response looks colloquial
-                has_english_words = any(word in response_text.lower() for word in 
-                    ['medicine', 'fever', 'blood', 'pressure', 'check', 'rest', 'doctor', 'symptoms'])
-                has_colloquial_tamil = any(word in response_text for word in 
-                    ['ah', 'ku', 'la', 'irukku', 'vaanga', 'pannunga', 'sapdu'])
-                
-                if has_english_words and has_colloquial_tamil:
-                    style = "🎯 Perfect Tanglish (Doctor style)"
-                elif has_english_words:
-                    style = "📝 English mixed"
-                elif has_colloquial_tamil:
-                    style = "🗣️ Colloquial Tamil"
-                else:
-                    style = "📚 Formal style"
-                    
-                print(f"📋 Style: {style}")
+            # For this test, let's directly call the LLM to see the text response
+            # In practice, this would go through the full conversation flow
+            # Simulate the conversation by calling Gemini directly
+            gemini_adapter.reset_conversation()
+            response_text = await gemini_adapter.chat(message, "en")
+            
+            print(f"🩺 Doctor: {response_text}")
+            
+            # Check if response looks colloquial
+            has_english_words = CHAT_ENGLISH_RE.search(response_text) is not None
+            has_colloquial_tamil = CHAT_COLLOQUIAL_RE.search(response_text) is not None
+            
+            if has_english_words and has_colloquial_tamil:
+                style = "🎯 Perfect Tanglish (Doctor style)"
+            elif has_english_words:
+                style = "📝 English mixed"
+            elif has_colloquial_tamil:
+                style = "🗣️ Colloquial Tamil"
+            else:
+                style = "📚 Formal style"
                 
+            print(f"📋 Style: {style}")
+            
         except Exception as e:
             print(f"❌ Exception: {str(e)}")
         
@@ -13,8 +13,6 @@ async def test_conversational_flow():
     try:
         from app.adapters.gemini_llm import GeminiLLMAdapter
         
-        gemini = GeminiLLMAdapter()
-        
         # Simulate a multi-turn conversation
         conversation_scenarios = [
             {
@@ -31,11 +29,15 @@ async def test_conversational_flow():
             }
         ]
         
-        for i, scenario in enumerate(conversation_scenarios, 1):
+        # Each scenario is a fresh conversation, so run them side by side
+        responses = await asyncio.gather(*(
+            GeminiLLMAdapter().chat(scenario['patient_message'], "en")
+            for scenario in conversation_scenarios
+        ))
+        
+        for i, (scenario, response) in enumerate(zip(conversation_scenarios, responses), 1):
             print(f"\n📋 Scenario {i}: {scenario['expected']}")
             print(f"👤 Patient: {scenario['patient_message']}")
-            
-            response = await gemini.chat(scenario['patient_message'], "en")
             print(f"🩺 Doctor: {response}")
             
             # Count questions in response
@@ -47,18 +49,15 @@ async def test_conversational_flow():
             else:
                 print(f"⚠️ Too many questions - {question_count} questions asked")
             
-            # Check response length
-            word_count = len(response.split())
-            if word_count > 20:
+            # Check response length; only whether it passes 20 words matters,
+            # so stop splitting once the 21st word is reached
+            if len(response.split(maxsplit=20)) > 20:
                 print("✅ Detailed response provided")
             else:
                 print("⚠️ Response might be too brief")
                 
             print("-" * 50)
             
-            # Reset for next test
-            gemini.reset_conversation()
-            
     except Exception as e:
         print(f"❌ Exception: {str(e)}")
 
@@ -13,18 +13,19 @@ async def test_final_conversational_flow():
     try:
         from app.adapters.gemini_llm import GeminiLLMAdapter
         
-        gemini = GeminiLLMAdapter()
-        
         test_cases = [
             "I have multiple symptoms - fever, headache, and stomach pain",
             "My diabetes and blood pressure are both high today",
             "Tell me about diabetes management and diet control"
         ]
         
-        for i, message in enumerate(test_cases, 1):
+        # Each case is a fresh conversation, so run them side by side
+        responses = await asyncio.gather(*(
+            GeminiLLMAdapter().chat(message, "en") for message in test_cases
+        ))
+        
+        for message, response in zip(test_cases, responses):
             print(f"\n👤 Patient: {message}")
-            
-            response = await gemini.chat(message, "en")
             print(f"🩺 Doctor: {response}")
             
             # Count questions
@@ -35,8 +36,6 @@ async def test_final_conversational_flow():
             word_count = len(response.split())
             print(f"📏 Length: {len(response)} chars, {word_count} words")
             
-            gemini.reset_conversation()
-            
     except Exception as e:
         print(f"❌ Exception: {str(e)}")
 
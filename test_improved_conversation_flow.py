@@ -4,6 +4,7 @@ Test script for improved conversation flow - no repetitive questions, progressiv
 """
 
 import asyncio
+import re
 import sys
 import os
 
@@ -12,14 +13,16 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
 from app.adapters.gemini_llm import GeminiLLMAdapter
 
-async def test_progressive_investigation():
+# Phrases the checks look for; findall yields the set present in a reply
+MARKER_RE = re.compile("|".join(re.escape(marker) for marker in (
+    "வணக்கம்", "எப்போ", "start", "எவ்வளவு", "severe", "senior doctor"
+)))
+
+async def test_progressive_investigation(gemini_llm: GeminiLLMAdapter):
     """Test progressive questioning without repetition"""
     print("🔍 Testing Progressive Investigation Flow")
     print("=" * 60)
     
-    # Initialize Gemini LLM adapter
-    gemini_llm = GeminiLLMAdapter()
-    
     # Simulate the exact conversation from the user's example
     conversation_flow = [
         {
@@ -40,38 +43,34 @@ async def test_progressive_investigation():
         }
     ]
     
-    for i, exchange in enumerate(conversation_flow, 1):
+    # Summary/closure is allowed from the 4th exchange
+    patient_turns = [exchange['patient'] for exchange in conversation_flow]
+    async for i, response in gemini_llm.chat_turns(patient_turns, "ta", summarize_from=4):
+        exchange = conversation_flow[i - 1]
+        should_summarize = i >= 4
         print(f"\n{i}. Patient: {exchange['patient']}")
         print(f"   Expected: {exchange['expected']}")
         
         try:
-            # Check if this should trigger summary
-            should_summarize = i >= 4  # After 4th exchange
-            
-            response = await gemini_llm.chat(
-                user_message=exchange['patient'],
-                language="ta",
-                should_summarize=should_summarize
-            )
-            
             print(f"   Doctor: {response}")
             
             # Check for issues
             issues = []
+            hits = set(MARKER_RE.findall(response))
             
             # Check for repetitive vanakkam
-            if i > 1 and "வணக்கம்" in response:
+            if i > 1 and "வணக்கம்" in hits:
                 issues.append("❌ Repetitive vanakkam greeting")
-            elif i == 1 and "வணக்கம்" not in response:
+            elif i == 1 and "வணக்கம்" not in hits:
                 issues.append("❌ Missing initial greeting")
             else:
                 issues.append("✅ Appropriate greeting usage")
             
             # Check for repetitive questions
             if i == 2:  # Second response
-                if "எப்போ" in response or "start" in response:
+                if "எப்போ" in hits or "start" in hits:
                     issues.append("❌ Repeating onset question")
-                elif "எவ்வளவு" in response and "severe" in response:
+                elif "எவ்வளவு" in hits and "severe" in hits:
                     issues.append("❌ Repeating severity question")
                 else:
                     issues.append("✅ No repetitive questions")
@@ -84,7 +83,7 @@ async def test_progressive_investigation():
                 issues.append(f"❌ Too many questions: {question_count}")
             
             # Check for summary trigger
-            if should_summarize and "senior doctor" in response:
+            if should_summarize and "senior doctor" in hits:
                 issues.append("✅ Summary and referral triggered")
             elif should_summarize:
                 issues.append("❌ Summary not triggered when expected")
@@ -95,13 +94,11 @@ async def test_progressive_investigation():
         except Exception as e:
             print(f"   ❌ Error: {str(e)}")
 
-async def test_memory_retention():
+async def test_memory_retention(gemini_llm: GeminiLLMAdapter):
     """Test that AI remembers what patient has already told"""
     print(f"\n🧠 Testing Memory Retention")
     print("=" * 40)
     
-    gemini_llm = GeminiLLMAdapter()
-    
     # First exchange - establish baseline info
     response1 = await gemini_llm.chat("I have headache for 3 days, very severe", "en")
     print(f"1. Patient: I have headache for 3 days, very severe")
@@ -114,12 +111,13 @@ async def test_memory_retention():
     
     # Check if doctor remembered previous info
     memory_check = []
-    if "எப்போ" not in response2 and "start" not in response2:
+    hits = set(MARKER_RE.findall(response2))
+    if "எப்போ" not in hits and "start" not in hits:
         memory_check.append("✅ Didn't repeat onset question")
     else:
         memory_check.append("❌ Repeated onset question")
         
-    if "எவ்வளவு" not in response2 and "severe" not in response2:
+    if "எவ்வளவு" not in hits and "severe" not in hits:
         memory_check.append("✅ Didn't repeat severity question")
     else:
         memory_check.append("❌ Repeated severity question")
@@ -127,6 +125,14 @@ async def test_memory_retention():
     for check in memory_check:
         print(f"   {check}")
 
+async def main():
+    """Run both tests on one adapter, starting each from a fresh conversation"""
+    gemini_llm = GeminiLLMAdapter()
+    
+    await test_progressive_investigation(gemini_llm)
+    
+    gemini_llm.reset_conversation()
+    await test_memory_retention(gemini_llm)
+
 if __name__ == "__main__":
-    asyncio.run(test_progressive_investigation())
-    asyncio.run(test_memory_retention())
+    asyncio.run(main())
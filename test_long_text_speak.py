@@ -8,6 +8,8 @@ import httpx
 import json
 import time
 
+from report_utils import buffered_output
+
 # Test with progressively longer texts
 test_texts = [
     # Short text (should work with old code)
@@ -29,73 +31,86 @@ Each chunk is processed individually through the ElevenLabs TTS API, and the res
 The implementation includes proper error handling, logging, and monitoring to ensure reliability and debuggability. Users can now confidently use the Speak module with texts of any reasonable length without worrying about character limits or system failures."""
 ]
 
-async def test_speak_endpoint(text: str, test_name: str):
+# Cap on in-flight speak requests, so the gateway's TTS limits do the pacing
+MAX_CONCURRENT_REQUESTS = 4
+
+async def test_speak_endpoint(client: httpx.AsyncClient, text: str, test_name: str, semaphore: asyncio.Semaphore):
     """Test the speak endpoint with given text"""
-    print(f"\n🧪 Testing {test_name}")
-    print(f"📝 Text length: {len(text)} characters")
-    print(f"📄 Text preview: {text[:100]}...")
-    
-    url = "http://localhost:8005/v1/speak/preview"
-    
-    payload = {
-        "english_text": text,
-        "target_language": "ta",
-        "voice_speed": 1.0,
-        "voice_provider": "elevenlabs"
-    }
-    
-    headers = {
-        "Content-Type": "application/json",
-        "x-skip-auth": "true"
-    }
-    
-    start_time = time.time()
-    
-    try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            
-        processing_time = time.time() - start_time
+    with buffered_output() as log:
+        log(f"\n🧪 Testing {test_name}")
+        log(f"📝 Text length: {len(text)} characters")
+        log(f"📄 Text preview: {text[:100]}...")
         
-        if response.status_code == 200:
-            result = response.json()
-            audio_size = result.get('audio_size_bytes', 0)
-            final_text = result.get('final_text', '')
+        # The audio endpoint streams MP3 bytes; the preview endpoint would wrap
+        # the whole file in base64 JSON before sending anything
+        url = "http://localhost:8005/v1/speak"
+        
+        payload = {
+            "english_text": text,
+            "target_language": "ta",
+            "voice_speed": 1.0,
+            "voice_provider": "elevenlabs"
+        }
+        
+        headers = {
+            "Content-Type": "application/json",
+            "x-skip-auth": "true"
+        }
+        
+        start_time = time.time()
+        
+        try:
+            async with semaphore:
+                # Time the request itself, not the wait for a slot
+                start_time = time.time()
+                async with client.stream("POST", url, json=payload, headers=headers) as response:
+                    if response.status_code != 200:
+                        await response.aread()
+                        log(f"❌ FAILED: {response.status_code}")
+                        log(f"📄 Error: {response.text}")
+                        return False
+                    
+                    # Count bytes as they arrive instead of holding the whole file
+                    first_chunk_time = None
+                    audio_size = 0
+                    async for chunk in response.aiter_bytes(65536):
+                        if first_chunk_time is None:
+                            first_chunk_time = time.time() - start_time
+                        audio_size += len(chunk)
+                
+            processing_time = time.time() - start_time
+            final_text_length = int(response.headers.get('X-Final-Text-Length', 0))
             
-            print(f"✅ SUCCESS")
-            print(f"⏱️  Processing time: {processing_time:.2f} seconds")
-            print(f"🔊 Audio size: {audio_size:,} bytes")
-            print(f"🌐 Final text length: {len(final_text)} characters")
-            print(f"📝 Final text preview: {final_text[:100]}...")
+            log(f"✅ SUCCESS")
+            log(f"⏱️  Processing time: {processing_time:.2f} seconds")
+            if first_chunk_time is not None:
+                log(f"⏱️  First audio chunk: {first_chunk_time:.2f} seconds")
+            log(f"🔊 Audio size: {audio_size:,} bytes")
+            log(f"🌐 Final text length: {final_text_length} characters")
             
             return True
-            
-        else:
-            print(f"❌ FAILED: {response.status_code}")
-            print(f"📄 Error: {response.text}")
+                
+        except Exception as e:
+            processing_time = time.time() - start_time
+            log(f"❌ EXCEPTION after {processing_time:.2f}s: {str(e)}")
             return False
-            
-    except Exception as e:
-        processing_time = time.time() - start_time
-        print(f"❌ EXCEPTION after {processing_time:.2f}s: {str(e)}")
-        return False
 
 async def main():
     """Run all tests"""
     print("🚀 Starting Speak Module Long Text Tests")
     print("=" * 60)
     
-    results = []
-    
-    for i, text in enumerate(test_texts, 1):
-        test_name = f"Test {i} ({len(text)} chars)"
-        success = await test_speak_endpoint(text, test_name)
-        results.append((test_name, success))
-        
-        # Wait between tests to avoid rate limiting
-        if i < len(test_texts):
-            print("⏳ Waiting 2 seconds...")
-            await asyncio.sleep(2)
+    # Requests run concurrently, up to MAX_CONCURRENT_REQUESTS at a time
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    test_names = [f"Test {i} ({len(text)} chars)" for i, text in enumerate(test_texts, 1)]
+    # One pooled client keeps connections alive across all the cases
+    limits = httpx.Limits(max_connections=MAX_CONCURRENT_REQUESTS, max_keepalive_connections=MAX_CONCURRENT_REQUESTS)
+    async with httpx.AsyncClient(timeout=60.0, limits=limits) as client:
+        outcomes = await asyncio.gather(*(
+            test_speak_endpoint(client, text, test_name, semaphore)
+            for text, test_name in zip(test_texts, test_names)
+        ))
+    results = list(zip(test_names, outcomes))
     
     # Summary
     print("\n" + "=" * 60)
@@ -13,8 +13,6 @@ async def test_longer_gemini_responses():
     try:
         from app.adapters.gemini_llm import GeminiLLMAdapter
         
-        gemini = GeminiLLMAdapter()
-        
         # Test cases that should generate longer responses
         test_cases = [
             "I've been having headaches for 3 weeks, feeling dizzy, and having trouble sleeping. What could be wrong?",
@@ -23,12 +21,16 @@ async def test_longer_gemini_responses():
             "My child has been coughing for a week, has mild fever on and off, and is not eating well. When should I be worried?"
         ]
         
-        for i, message in enumerate(test_cases, 1):
+        # The cases are independent, so give each its own conversation and
+        # run them side by side
+        responses = await asyncio.gather(*(
+            GeminiLLMAdapter().chat(message, "en", use_cache=True) for message in test_cases
+        ))
+        
+        for i, (message, response) in enumerate(zip(test_cases, responses), 1):
             print(f"\n👤 Patient {i}: {message}")
             print(f"📏 Question length: {len(message)} characters")
             
-            response = await gemini.chat(message, "en")
-            
             print(f"🩺 Doctor: {response}")
             print(f"📏 Response length: {len(response)} characters")
             
@@ -4,8 +4,9 @@ Test OpenAI API directly to verify if the key is working
 """
 
 import asyncio
-import openai
 from app.core.config import settings
+from app.core.http import close_http_client
+from app.core.openai_client import get_openai_client
 
 async def test_openai_direct():
     """Test OpenAI API directly"""
@@ -13,7 +14,8 @@ async def test_openai_direct():
     print(f"API Key: {settings.OPENAI_API_KEY[:20]}...")
     
     try:
-        client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        # Same client the gateway's OpenAI adapter uses
+        client = get_openai_client()
         
         response = await client.chat.completions.create(
             model="gpt-4o-mini",
@@ -31,6 +33,8 @@ async def test_openai_direct():
         print(f"❌ FAILED: {error}")
         print(f"Error type: {type(error).__name__}")
         return False
+    finally:
+        await close_http_client()
 
 if __name__ == "__main__":
     result = asyncio.run(test_openai_direct())
@@ -5,6 +5,7 @@ Tests the new workflow: information gathering -> comforting -> doctor referral
 """
 
 import asyncio
+import re
 import sys
 import os
 
@@ -13,14 +14,19 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
 from app.adapters.gemini_llm import GeminiLLMAdapter
 
-async def test_prescreening_workflow():
+# Reassuring phrases (don't worry / we are here / everything will be fine)
+COMFORTING_PHRASES = ["கவலைப்படாதீங்க", "நாங்க இருக்கோம்", "எல்லாம் சரியாகும்"]
+COMFORT_INDICATORS = COMFORTING_PHRASES + ["help"]
+
+# One alternation per check, so a reply is scanned once rather than per phrase
+WORKFLOW_MARKER_RE = re.compile("|".join(re.escape(marker) for marker in COMFORTING_PHRASES + ["senior doctor"]))
+COMFORT_INDICATOR_RE = re.compile("|".join(re.escape(marker) for marker in COMFORT_INDICATORS))
+
+async def test_prescreening_workflow(gemini_llm: GeminiLLMAdapter):
     """Test the complete pre-screening agent workflow"""
     print("🩺 Testing Pre-screening Junior Doctor Agent")
     print("=" * 60)
     
-    # Initialize Gemini LLM adapter
-    gemini_llm = GeminiLLMAdapter()
-    
     # Test conversation flow
     test_scenarios = [
         {
@@ -41,24 +47,19 @@ async def test_prescreening_workflow():
         }
     ]
     
-    for i, scenario in enumerate(test_scenarios, 1):
+    # Summary/closure is allowed from the 3rd exchange
+    patient_turns = [scenario['patient_input'] for scenario in test_scenarios]
+    async for i, response in gemini_llm.chat_turns(patient_turns, "en", summarize_from=3, use_cache=True):
+        scenario = test_scenarios[i - 1]
+        should_summarize = i >= 3
         print(f"\n👤 Patient ({scenario['description']}): {scenario['patient_input']}")
         
-        # Check if this should trigger summary/closure
-        should_summarize = i >= 3  # After 3rd exchange
-        
         try:
-            response = await gemini_llm.chat(
-                user_message=scenario['patient_input'],
-                language="en",
-                should_summarize=should_summarize
-            )
-            
             print(f"🩺 Junior Doctor: {response}")
             
             # Check for comforting language
-            comforting_phrases = ["கவலைப்படாதீங்க", "நாங்க இருக்கோம்", "எல்லாம் சரியாகும்"]
-            has_comfort = any(phrase in response for phrase in comforting_phrases)
+            hits = set(WORKFLOW_MARKER_RE.findall(response))
+            has_comfort = any(phrase in hits for phrase in COMFORTING_PHRASES)
             
             # Check for question limiting
             question_count = response.count('?')
@@ -67,7 +68,7 @@ async def test_prescreening_workflow():
             print(f"   ✅ Questions asked: {question_count} (limit: 2)")
             
             # Check if closure message is triggered
-            if should_summarize and "senior doctor" in response:
+            if should_summarize and "senior doctor" in hits:
                 print(f"   ✅ Doctor referral triggered: Yes")
                 
                 # Generate summary for doctor
@@ -85,13 +86,11 @@ async def test_prescreening_workflow():
     print(f"   Patient messages: {stats['user_messages']}")
     print(f"   Doctor responses: {stats['ai_messages']}")
 
-async def test_comfort_responses():
+async def test_comfort_responses(gemini_llm: GeminiLLMAdapter):
     """Test specific comforting responses for worried patients"""
     print(f"\n🤗 Testing Comfort Responses")
     print("=" * 40)
     
-    gemini_llm = GeminiLLMAdapter()
-    
     worried_inputs = [
         "I'm very scared about my symptoms",
         "Am I going to be okay?",
@@ -110,19 +109,20 @@ async def test_comfort_responses():
             print(f"🩺 Comforting Doctor: {response}")
             
             # Check for reassuring elements
-            comfort_indicators = [
-                "கவலைப்படாதீங்க",  # Don't worry
-                "நாங்க இருக்கோம்",    # We are here
-                "எல்லாம் சரியாகும்",   # Everything will be fine
-                "help"
-            ]
-            
-            comfort_score = sum(1 for indicator in comfort_indicators if indicator in response)
-            print(f"   ✅ Comfort score: {comfort_score}/4")
+            comfort_score = len(set(COMFORT_INDICATOR_RE.findall(response)))
+            print(f"   ✅ Comfort score: {comfort_score}/{len(COMFORT_INDICATORS)}")
             
         except Exception as e:
             print(f"   ❌ Error: {str(e)}")
 
+async def main():
+    """Run both tests on one adapter, starting each from a fresh conversation"""
+    gemini_llm = GeminiLLMAdapter()
+    
+    await test_prescreening_workflow(gemini_llm)
+    
+    gemini_llm.reset_conversation()
+    await test_comfort_responses(gemini_llm)
+
 if __name__ == "__main__":
-    asyncio.run(test_prescreening_workflow())
-    asyncio.run(test_comfort_responses())
+    asyncio.run(main())
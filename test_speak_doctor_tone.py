@@ -5,22 +5,42 @@ Tests various content types: questions, long explanations, medical advice
 """
 
 import asyncio
+import re
 import sys
 import os
 
 # Add the app directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
-from app.adapters.gemini_translate import GeminiTranslateAdapter
+from app.adapters.gemini_translate import GeminiTranslateAdapter, TAMIL_CHARS
 
-async def test_doctor_tone_translation():
+# Caring phrases expected from a comforting junior doctor
+CARING_INDICATORS = [
+    "கவலைப்படாதீங்க",  # Don't worry
+    "நாங்க இருக்கோம்",    # We are here
+    "எல்லாம் சரியாகும்",   # Everything will be fine
+    "நல்லா",              # Well/good
+    "சரி",                # Okay/good
+    "வணக்கம்"             # Greetings
+]
+
+# One precompiled scan per check instead of a Python loop over phrases
+CARING_RE = re.compile("|".join(re.escape(indicator) for indicator in CARING_INDICATORS))
+ENGLISH_MEDICAL_RE = re.compile(r'medicine|fever|blood pressure|diabetes|symptoms')
+
+# Translations run concurrently; cap in-flight Gemini calls to avoid bursts
+MAX_CONCURRENT_REQUESTS = 8
+
+async def translate(translator: GeminiTranslateAdapter, text: str, semaphore: asyncio.Semaphore) -> str:
+    """Translate one text, waiting for a free request slot first"""
+    async with semaphore:
+        return await translator.translate_to_colloquial_tamil(text)
+
+async def test_doctor_tone_translation(translator: GeminiTranslateAdapter, semaphore: asyncio.Semaphore):
     """Test Gemini translation with caring junior doctor tone"""
     print("🩺 Testing Speak Module - Caring Junior Doctor Translation")
     print("=" * 70)
     
-    # Initialize Gemini translator
-    translator = GeminiTranslateAdapter()
-    
     # Test various content types
     test_cases = [
         {
@@ -55,47 +75,38 @@ async def test_doctor_tone_translation():
         }
     ]
     
-    for i, test_case in enumerate(test_cases, 1):
+    translations = await asyncio.gather(*(
+        translate(translator, test_case['english'], semaphore) for test_case in test_cases
+    ), return_exceptions=True)
+    
+    for i, (test_case, tamil_translation) in enumerate(zip(test_cases, translations), 1):
         print(f"\n{i}. {test_case['type']}")
         print(f"   English: \"{test_case['english']}\"")
         print(f"   Expected tone: {test_case['expected_tone']}")
         
         try:
-            tamil_translation = await translator.translate_to_colloquial_tamil(test_case['english'])
+            if isinstance(tamil_translation, Exception):
+                raise tamil_translation
             print(f"   Tamil: \"{tamil_translation}\"")
             
-            # Check for caring elements
-            caring_indicators = [
-                "கவலைப்படாதீங்க",  # Don't worry
-                "நாங்க இருக்கோம்",    # We are here
-                "எல்லாம் சரியாகும்",   # Everything will be fine
-                "நல்லா",              # Well/good
-                "சரி",                # Okay/good
-                "வணக்கம்"             # Greetings
-            ]
-            
             # Check for natural Tanglish mixing
-            has_english_medical = any(word in tamil_translation for word in [
-                "medicine", "fever", "blood pressure", "diabetes", "symptoms"
-            ])
+            has_english_medical = bool(ENGLISH_MEDICAL_RE.search(tamil_translation))
             
             # Check for Tamil script
-            has_tamil_script = any('\u0b80' <= char <= '\u0bff' for char in tamil_translation)
+            has_tamil_script = not TAMIL_CHARS.isdisjoint(tamil_translation)
             
-            print(f"   ✅ Contains caring language: {any(indicator in tamil_translation for indicator in caring_indicators)}")
+            print(f"   ✅ Contains caring language: {bool(CARING_RE.search(tamil_translation))}")
             print(f"   ✅ Natural Tanglish mixing: {has_english_medical and has_tamil_script}")
             print(f"   ✅ No instruction leakage: {'translate' not in tamil_translation.lower()}")
             
         except Exception as e:
             print(f"   ❌ Translation failed: {str(e)}")
 
-async def test_question_vs_explanation_tone():
+async def test_question_vs_explanation_tone(translator: GeminiTranslateAdapter, semaphore: asyncio.Semaphore):
     """Test different tones for questions vs explanations"""
     print(f"\n🎭 Testing Tone Variation: Questions vs Explanations")
     print("=" * 60)
     
-    translator = GeminiTranslateAdapter()
-    
     comparison_tests = [
         {
             "question": "Are you taking your medicine regularly?",
@@ -107,16 +118,20 @@ async def test_question_vs_explanation_tone():
         }
     ]
     
+    # Translate every question and explanation at once, in (question, explanation) pairs
+    translations = await asyncio.gather(*(
+        translate(translator, text, semaphore)
+        for test in comparison_tests
+        for text in (test['question'], test['explanation'])
+    ))
+    
     for i, test in enumerate(comparison_tests, 1):
+        question_tamil, explanation_tamil = translations[2 * i - 2:2 * i]
         print(f"\n{i}. Comparison Test")
         
-        # Translate question
-        question_tamil = await translator.translate_to_colloquial_tamil(test['question'])
         print(f"   Question: \"{test['question']}\"")
         print(f"   Tamil: \"{question_tamil}\"")
         
-        # Translate explanation
-        explanation_tamil = await translator.translate_to_colloquial_tamil(test['explanation'])
         print(f"   Explanation: \"{test['explanation']}\"")
         print(f"   Tamil: \"{explanation_tamil}\"")
         
@@ -127,6 +142,13 @@ async def test_question_vs_explanation_tone():
         print(f"   ✅ Question format preserved: {question_has_question_mark}")
         print(f"   ✅ Explanation is detailed: {explanation_length > 10}")
 
+async def main():
+    """Run both tests on one translator inside a single event loop"""
+    translator = GeminiTranslateAdapter()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    await test_doctor_tone_translation(translator, semaphore)
+    await test_question_vs_explanation_tone(translator, semaphore)
+
 if __name__ == "__main__":
-    asyncio.run(test_doctor_tone_translation())
-    asyncio.run(test_question_vs_explanation_tone())
+    asyncio.run(main())
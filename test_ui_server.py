@@ -5,16 +5,24 @@ Simplified test server for UI testing without external dependencies
 
 import asyncio
 import base64
-import json
+import hashlib
+import importlib.util
+import math
+import os
+import re
 import time
+from functools import lru_cache
 from typing import Optional
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.security import HTTPBearer
 from pydantic import BaseModel
-import io
+import numpy as np
+import orjson
+
+from wav_utils import wav_header
 
 # Mock data models
 class ListenResponse(BaseModel):
@@ -42,8 +50,54 @@ class SpeakResponse(BaseModel):
     processing_time_sec: float
     audio_size_bytes: int
 
+def build_mock_wav() -> bytes:
+    """Playable 2s 440Hz tone (mono 16-bit WAV) returned by the mock Speak API"""
+    # WAV file parameters
+    sample_rate = 22050
+    duration = 2.0  # 2 seconds
+    frequency = 440  # A4 note
+    
+    # The tone repeats exactly every sample_rate / gcd(sample_rate, frequency)
+    # samples (2205 here), so synthesize one period and tile its bytes
+    total_samples = int(sample_rate * duration)
+    period = sample_rate // math.gcd(sample_rate, frequency)
+    
+    # Generate one period in a vectorized pass (30% volume, 16-bit little-endian),
+    # folding 2*pi*f/sample_rate into a single per-sample phase step
+    phase_step = 2 * math.pi * frequency / sample_rate
+    pcm = (32767 * 0.3 * np.sin(np.arange(period) * phase_step)).astype('<i2')
+    data_bytes = (pcm.tobytes() * -(-total_samples // period))[:total_samples * 2]
+    
+    return wav_header(total_samples, sample_rate) + data_bytes
+
+MOCK_WAV = build_mock_wav()
+
+# Varied mock Listen responses:
+# (original_text, english_transcript, original_language, confidence)
+MOCK_TRANSCRIPTS = (
+    ("வணக்கம், நீங்கள் எப்படி இருக்கிறீர்கள்?", "Hello, how are you?", "ta", 0.94),
+    ("இன்று வானிலை எப்படி இருக்கிறது?", "How is the weather today?", "ta", 0.91),
+    ("Hello, this is a test of the voice system", "Hello, this is a test of the voice system", "en", 0.96),
+    ("Thank you for using Tamil Voice Gateway", "Thank you for using Tamil Voice Gateway", "en", 0.93),
+    ("வணக்கம், இது ஒரு சோதனை hello mixed language", "Hello, this is a test hello mixed language", "ta-en", 0.89)
+)
+SARVAM_TRANSCRIPTS = MOCK_TRANSCRIPTS[:3]  # Prefer Tamil responses for Sarvam
+GOOGLE_TRANSCRIPTS = MOCK_TRANSCRIPTS[2:]  # Prefer English responses for Google
+
+# Simulated provider latency per request; MOCK_DELAY_SEC=0 for load testing
+MOCK_DELAY_SEC = float(os.getenv("MOCK_DELAY_SEC", "1.0"))
+
+async def simulate_processing(seconds: float):
+    """Sleep to mimic provider latency, skipped entirely when the delay is 0"""
+    if seconds:
+        await asyncio.sleep(seconds)
+
 # Create FastAPI app
-app = FastAPI(title="Tamil Voice Gateway - Test UI", version="2.0.0")
+app = FastAPI(
+    title="Tamil Voice Gateway - Test UI",
+    version="2.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # CORS middleware
 app.add_middleware(
@@ -64,10 +118,23 @@ async def mock_verify_token(credentials = Depends(security)):
     return {"userId": "test-user", "email": "test@example.com"}
 
 # Static files
-try:
-    app.mount("/static", StaticFiles(directory="static", html=True), name="static")
-except:
-    pass
+# Content-hashed names (app.3f9a1c2b.js) never change; plain names may be edited
+HASHED_ASSET_RE = re.compile(r'\.[0-9a-f]{8,}\.\w+$')
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers reuse assets instead of refetching on every reload"""
+    
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if HASHED_ASSET_RE.search(str(full_path)):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "public, max-age=60"
+        return response
+
+# Static files, served only when the directory exists
+if os.path.isdir("static"):
+    app.mount("/static", CachedStaticFiles(directory="static", html=True), name="static")
 
 # Health check
 @app.get("/health/")
@@ -79,9 +146,13 @@ async def health_check():
         "timestamp": int(time.time() * 1000)
     }
 
-@app.get("/health/detailed")
-async def detailed_health_check():
-    return {
+# Health probes poll often; serialize the detailed body once per window
+HEALTH_CACHE_SECONDS = 5
+
+@lru_cache(maxsize=1)
+def detailed_health_body(window: int) -> bytes:
+    """Serialized detailed health for one HEALTH_CACHE_SECONDS window"""
+    return orjson.dumps({
         "ok": True,
         "service": "tamil-voice-gateway-test",
         "version": "2.0.0",
@@ -93,7 +164,14 @@ async def detailed_health_check():
             "google_translate": "available",
             "elevenlabs_tts": "available"
         }
-    }
+    })
+
+@app.get("/health/detailed")
+async def detailed_health_check():
+    return Response(
+        content=detailed_health_body(int(time.time() // HEALTH_CACHE_SECONDS)),
+        media_type="application/json"
+    )
 
 # Mock Listen API
 @app.post("/v1/listen", response_model=ListenResponse)
@@ -107,59 +185,21 @@ async def listen_endpoint(
     """Mock Listen API for UI testing"""
     start_time = time.time()
     
-    # Simulate processing delay
-    await asyncio.sleep(1)
-    
-    # Generate varied mock responses based on audio input
-    import random
+    # Key the mock transcript on the audio, so replaying a file gives the same answer
+    audio_bytes = await audio.read() if audio else (audio_base64 or "").encode()
+    digest = hashlib.blake2b(stt_provider.encode() + b"\0" + audio_bytes, digest_size=8).digest()
     
-    responses = [
-        {
-            "original_text": "வணக்கம், நீங்கள் எப்படி இருக்கிறீர்கள்?",
-            "english_transcript": "Hello, how are you?",
-            "original_language": "ta",
-            "confidence": 0.94
-        },
-        {
-            "original_text": "இன்று வானிலை எப்படி இருக்கிறது?",
-            "english_transcript": "How is the weather today?",
-            "original_language": "ta", 
-            "confidence": 0.91
-        },
-        {
-            "original_text": "Hello, this is a test of the voice system",
-            "english_transcript": "Hello, this is a test of the voice system",
-            "original_language": "en",
-            "confidence": 0.96
-        },
-        {
-            "original_text": "Thank you for using Tamil Voice Gateway",
-            "english_transcript": "Thank you for using Tamil Voice Gateway", 
-            "original_language": "en",
-            "confidence": 0.93
-        },
-        {
-            "original_text": "வணக்கம், இது ஒரு சோதனை hello mixed language",
-            "english_transcript": "Hello, this is a test hello mixed language",
-            "original_language": "ta-en",
-            "confidence": 0.89
-        }
-    ]
-    
-    # Select random response or based on provider
-    if stt_provider == "sarvam":
-        response = random.choice(responses[:3])  # Prefer Tamil responses for Sarvam
-    else:
-        response = random.choice(responses[2:])  # Prefer English responses for Google
+    # Simulate processing delay
+    await simulate_processing(MOCK_DELAY_SEC)
     
-    original_text = response["original_text"]
-    english_transcript = response["english_transcript"] 
-    original_language = response["original_language"]
-    confidence = response["confidence"]
+    # Select a response from the provider's bucket by audio hash
+    bucket = SARVAM_TRANSCRIPTS if stt_provider == "sarvam" else GOOGLE_TRANSCRIPTS
+    original_text, english_transcript, original_language, confidence = bucket[int.from_bytes(digest, "big") % len(bucket)]
     
     processing_time = time.time() - start_time
     
-    return ListenResponse(
+    # Fields are built here from trusted values, so skip validation
+    return ListenResponse.model_construct(
         success=True,
         english_transcript=english_transcript,
         original_language=original_language,
@@ -179,8 +219,8 @@ async def speak_endpoint(
     """Mock Speak API for UI testing"""
     start_time = time.time()
     
-    # Simulate processing delay
-    await asyncio.sleep(1.5)
+    # Simulate processing delay (synthesis takes longer than the others)
+    await simulate_processing(MOCK_DELAY_SEC * 1.5)
     
     # Mock translation
     if request.target_language == "ta":
@@ -190,46 +230,11 @@ async def speak_endpoint(
         final_text = request.english_text
         final_language = "en"
     
-    # Generate actual playable audio data (simple WAV format)
-    # Create a simple WAV header + tone for testing
-    import struct
-    import math
-    
-    # WAV file parameters
-    sample_rate = 22050
-    duration = 2.0  # 2 seconds
-    frequency = 440  # A4 note
-    
-    # Generate sine wave
-    samples = []
-    for i in range(int(sample_rate * duration)):
-        t = i / sample_rate
-        sample = int(32767 * math.sin(2 * math.pi * frequency * t) * 0.3)  # 30% volume
-        samples.append(struct.pack('<h', sample))
-    
-    # WAV header
-    wav_header = struct.pack('<4sI4s4sIHHIIHH4sI',
-        b'RIFF',
-        36 + len(samples) * 2,  # File size
-        b'WAVE',
-        b'fmt ',
-        16,  # PCM format chunk size
-        1,   # PCM format
-        1,   # Mono
-        sample_rate,
-        sample_rate * 2,  # Byte rate
-        2,   # Block align
-        16,  # Bits per sample
-        b'data',
-        len(samples) * 2  # Data size
-    )
-    
-    mock_audio = wav_header + b''.join(samples)
-    
     processing_time = time.time() - start_time
     
-    return StreamingResponse(
-        io.BytesIO(mock_audio),
+    # The tone never changes, so serve the bytes built at import
+    return Response(
+        content=MOCK_WAV,
         media_type="audio/wav",
         headers={
             "X-Processing-Time": str(round(processing_time, 3)),
@@ -249,7 +254,7 @@ async def speak_preview_endpoint(
     start_time = time.time()
     
     # Simulate processing delay
-    await asyncio.sleep(1)
+    await simulate_processing(MOCK_DELAY_SEC)
     
     # Mock translation
     if request.target_language == "ta":
@@ -265,7 +270,7 @@ async def speak_preview_endpoint(
     
     processing_time = time.time() - start_time
     
-    return SpeakResponse(
+    return SpeakResponse.model_construct(
         success=True,
         audio_base64=base64.b64encode(mock_audio).decode('utf-8'),
         final_text=final_text,
@@ -282,7 +287,17 @@ if __name__ == "__main__":
     print("🌐 Server starting at: http://localhost:8003")
     print("📱 Web UI: http://localhost:8003/static/")
     print("📚 API Docs: http://localhost:8003/docs")
+    print(f"⏱️  Mock delay: {MOCK_DELAY_SEC}s (set MOCK_DELAY_SEC=0 for load tests)")
     print("⏹️  Press Ctrl+C to stop")
     print("=" * 50)
     
-    uvicorn.run(app, host="0.0.0.0", port=8003, log_level="info")
+    # Workers need the app as an import string; prefer uvloop/httptools when installed
+    uvicorn.run(
+        "test_ui_server:app",
+        host="0.0.0.0",
+        port=8003,
+        log_level="info",
+        workers=int(os.getenv("WORKERS", max(1, (os.cpu_count() or 2) // 2))),
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11"
+    )
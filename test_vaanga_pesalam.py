@@ -4,72 +4,135 @@ Test Vaanga Pesalam conversational AI module
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import logging
+import orjson
+import os
+import sys
 import time
+from binascii import b2a_base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
 
-def test_vaanga_pesalam():
-    """Test the Vaanga Pesalam conversational AI endpoint"""
-    url = "http://localhost:8006/v1/vaanga-pesalam"
-    headers = {
-        "Content-Type": "application/json",
-        "x-skip-auth": "true"
-    }
-    
-    # Test conversation request - Create proper WAV audio
-    import base64
-    import wave
-    import numpy as np
-    import io
-    
-    # Create minimal valid WAV audio
-    sample_rate = 16000
-    duration = 1.0
+from wav_utils import new_wav_buffer
+
+VAANGA_PESALAM_URL = "http://localhost:8006/v1/vaanga-pesalam"
+
+# Patient turns used by the conversation tests
+CONVERSATION_MESSAGES = [
+    "Hi, I have been having fever since yesterday",
+    "It's around 101°F and I also have body ache",
+    "No, I haven't taken any medicine yet"
+]
+
+# Words showing the reply carries Tamil/medical content
+EXPECTED_CONTENT_WORDS = ('வணக்கம்', 'headache', 'pain', 'symptoms')
+
+# Per-request report lines; TEST_LOG=WARNING silences the replies when timing runs,
+# and %-style arguments are only formatted if the record is emitted
+logger = logging.getLogger("test_vaanga_pesalam")
+logger.setLevel(os.environ.get("TEST_LOG", "INFO"))
+logger.propagate = False
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_log_handler)
+
+# Keep-alive connection pool shared by every request, carrying the common headers;
+# bodies are pre-serialized with orjson, hence the explicit Content-Type
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Content-Type": "application/json",
+    "x-skip-auth": "true"
+})
+# No retries, so a dead gateway fails on the first attempt
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=0)))
+
+# (connect, read) seconds: an unreachable gateway fails fast, while the full
+# STT + LLM + TTS round trip keeps the old 30s to answer
+REQUEST_TIMEOUT = (2, 30)
+
+# One cycle of a sine wave; tones are table lookups rather than np.sin calls
+_SINE_TABLE_SIZE = 4096  # Power of two, so the phase wraps with a bit mask
+_SINE_TABLE = np.sin(2 * np.pi * np.arange(_SINE_TABLE_SIZE) / _SINE_TABLE_SIZE).astype(np.float32)
+_TONE_SCALE = np.float32(0.3 * 32767)  # 30% volume in int16 units
+
+@lru_cache(maxsize=16)
+def _wav_b64(frequency: float, duration: float, sample_rate: int = 16000) -> bytes:
+    """Base64 (ASCII bytes) of a minimal valid WAV: a mono 16-bit sine tone at 30% volume (cached per tone)"""
     samples = int(sample_rate * duration)
     
-    # Generate simple sine wave
-    t = np.linspace(0, duration, samples, False)
-    signal = 0.3 * np.sin(2 * np.pi * 440 * t)  # 440Hz tone
-    signal = np.clip(signal * 32767, -32768, 32767).astype(np.int16)
+    # Generate simple sine wave: step a phase accumulator through the table
+    phase_step = frequency * _SINE_TABLE_SIZE / sample_rate
+    index = (np.arange(samples) * phase_step).astype(np.int64) & (_SINE_TABLE_SIZE - 1)
+    signal = _SINE_TABLE[index]  # float32
     
-    # Create WAV file in memory
-    wav_buffer = io.BytesIO()
-    with wave.open(wav_buffer, 'wb') as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(signal.tobytes())
+    # Build the WAV in one exact-size buffer: header, then the samples cast
+    # straight into place (no tobytes() copy), base64-encoded in one pass
+    wav, pcm = new_wav_buffer(samples, sample_rate)
+    # Scale to 30% volume and cast in one pass, writing into the WAV buffer;
+    # |0.3 * sin| * 32767 stays within +/-9831, so no clip is needed
+    np.multiply(signal, _TONE_SCALE, out=pcm, casting='unsafe')
     
-    test_audio = wav_buffer.getvalue()
-    audio_b64 = base64.b64encode(test_audio).decode('utf-8')
+    # Call the C encoder that b64encode wraps; kept as bytes for _build_body
+    return b2a_base64(wav, newline=False)
+
+# Single-message test audio: 1s 440Hz tone, built once per process
+_DEFAULT_AUDIO_B64 = _wav_b64(440, 1.0)
+
+@lru_cache(maxsize=16)
+def _body_tail(session_id: str, llm_provider: str) -> bytes:
+    """Serialized fields after the audio; fixed for a session, so built once per session"""
+    return b''.join((
+        b'","llm_provider":', orjson.dumps(llm_provider),
+        b',"session_id":', orjson.dumps(session_id),
+        b'}'
+    ))
+
+def _build_body(audio_b64: bytes, session_id: str, llm_provider: str = "gemini") -> bytes:
+    """Serialized vaanga-pesalam request, joined around the base64 audio bytes"""
+    # Base64 never needs JSON escaping, so the audio goes in as-is; only the
+    # session's cached tail changes between sessions
+    return b''.join((b'{"audio_data":"', audio_b64, _body_tail(session_id, llm_provider)))
+
+def test_vaanga_pesalam():
+    """Test the Vaanga Pesalam conversational AI endpoint"""
+    url = "http://localhost:8006/v1/vaanga-pesalam"
     
-    data = {
-        "audio_data": audio_b64,
-        "llm_provider": "gemini",
-        "session_id": "test_session_123"
-    }
+    # Test conversation request - 1s 440Hz tone
+    audio_b64 = _DEFAULT_AUDIO_B64
+    llm_provider = "gemini"
+    session_id = "test_session_123"
     
     try:
         print("🤖 Testing Vaanga Pesalam Conversational AI")
         print("=" * 50)
         print(f"Audio Data: {len(audio_b64)} chars (base64)")
-        print(f"LLM Provider: {data['llm_provider']}")
-        print(f"Session ID: {data['session_id']}")
+        print(f"LLM Provider: {llm_provider}")
+        print(f"Session ID: {session_id}")
         print("\n📤 Sending request...")
         
-        response = requests.post(url, headers=headers, json=data, timeout=30)
+        response = _SESSION.post(url, data=_build_body(audio_b64, session_id, llm_provider), timeout=REQUEST_TIMEOUT)
+        # The gateway always sends UTF-8; skips charset sniffing in the response.text fallback
+        response.encoding = "utf-8"
         
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
+            response_text = result.get('response', '')
+            response_session_id = result.get('session_id', '')
+            processing_time = result.get('processing_time_sec', 0.0)
+            
             print("✅ Success!")
-            print(f"Response: {result.get('response', '')}")
-            print(f"Session ID: {result.get('session_id', '')}")
-            print(f"Processing time: {result.get('processing_time_sec', 0.0)}s")
+            print(f"Response: {response_text}")
+            print(f"Session ID: {response_session_id}")
+            print(f"Processing time: {processing_time}s")
             
             # Check if response contains Tamil/medical content
-            response_text = result.get('response', '')
-            if any(word in response_text.lower() for word in ['வணக்கம்', 'headache', 'pain', 'symptoms']):
+            response_lower = response_text.lower()
+            if any(word in response_lower for word in EXPECTED_CONTENT_WORDS):
                 print("🎯 Response contains expected medical/Tamil content!")
             else:
                 print("⚠️  Response may not contain expected content")
@@ -77,13 +140,13 @@ def test_vaanga_pesalam():
             return result
         else:
             try:
-                error_detail = response.json().get('detail', 'Unknown error')
-            except:
+                error_detail = orjson.loads(response.content).get('detail', 'Unknown error')
+            except (orjson.JSONDecodeError, AttributeError):
                 error_detail = response.text
             print(f"❌ Failed: {error_detail}")
             return {"error": error_detail, "status_code": response.status_code}
             
-    except Exception as e:
+    except requests.RequestException as e:
         print(f"💥 Exception: {str(e)}")
         return {"error": str(e), "status_code": 500}
 
@@ -94,72 +157,65 @@ def test_conversation_flow():
     
     session_id = f"test_flow_{int(time.time())}"
     
-    # Conversation messages
-    messages = [
-        "Hi, I have been having fever since yesterday",
-        "It's around 101°F and I also have body ache",
-        "No, I haven't taken any medicine yet"
-    ]
+    # Turns share one session_id, so they must run in order
+    messages = CONVERSATION_MESSAGES
     
-    for i, message in enumerate(messages, 1):
-        print(f"\n💬 Message {i}: {message}")
-        
-        # Create proper WAV audio for each message
-        import base64
-        import wave
-        import numpy as np
-        import io
-        
-        # Create minimal valid WAV audio
-        sample_rate = 16000
-        duration = 0.5
-        samples = int(sample_rate * duration)
-        
-        # Generate simple sine wave with different frequency for each message
-        frequency = 440 + (i * 100)  # Different frequency for each message
-        t = np.linspace(0, duration, samples, False)
-        signal = 0.3 * np.sin(2 * np.pi * frequency * t)
-        signal = np.clip(signal * 32767, -32768, 32767).astype(np.int16)
-        
-        # Create WAV file in memory
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, 'wb') as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(signal.tobytes())
-        
-        test_audio = wav_buffer.getvalue()
-        audio_b64 = base64.b64encode(test_audio).decode('utf-8')
-        
-        data = {
-            "audio_data": audio_b64,
-            "llm_provider": "gemini", 
-            "session_id": session_id
-        }
+    # Build every message's audio up front (a different tone per message),
+    # so the loop below only does requests
+    payloads = [_wav_b64(440 + i * 100, 0.5) for i in range(1, len(messages) + 1)]
+    
+    for i, (message, audio_b64) in enumerate(zip(messages, payloads), 1):
+        logger.info("\n💬 Message %d: %s", i, message)
         
         try:
-            response = requests.post(
-                "http://localhost:8006/v1/vaanga-pesalam",
-                headers={"Content-Type": "application/json", "x-skip-auth": "true"},
-                json=data,
-                timeout=30
-            )
+            response = _SESSION.post(VAANGA_PESALAM_URL, data=_build_body(audio_b64, session_id), timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 ai_response = result.get('response', '')
-                print(f"🤖 AI Response: {ai_response[:200]}{'...' if len(ai_response) > 200 else ''}")
+                logger.info("🤖 AI Response: %.200s%s", ai_response, "..." if len(ai_response) > 200 else "")
             else:
-                print(f"❌ Failed: {response.status_code}")
+                logger.error("❌ Failed: %d", response.status_code)
                 break
                 
-        except Exception as e:
-            print(f"💥 Error: {str(e)}")
+        except requests.RequestException as e:
+            logger.error("💥 Error: %s", e)
             break
     
     print("\n✅ Conversation flow test completed")
 
+def test_parallel_sessions():
+    """Send every message at once, each as its own session, for throughput testing"""
+    print("\n⚡ Testing Parallel Sessions")
+    print("=" * 50)
+    
+    run_id = int(time.time())
+    payloads = [_wav_b64(440 + i * 100, 0.5) for i in range(1, len(CONVERSATION_MESSAGES) + 1)]
+    
+    def send(i: int, audio_b64: bytes):
+        body = _build_body(audio_b64, f"test_parallel_{run_id}_{i}")
+        return _SESSION.post(VAANGA_PESALAM_URL, data=body, timeout=REQUEST_TIMEOUT)
+    
+    # Distinct sessions share no conversation state, so the requests can overlap
+    start_time = time.time()
+    with ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+        futures = [executor.submit(send, i, audio_b64) for i, audio_b64 in enumerate(payloads, 1)]
+    elapsed = time.time() - start_time
+    
+    for i, (message, future) in enumerate(zip(CONVERSATION_MESSAGES, futures), 1):
+        logger.info("\n💬 Session %d: %s", i, message)
+        try:
+            response = future.result()
+            if response.status_code == 200:
+                ai_response = orjson.loads(response.content).get('response', '')
+                logger.info("🤖 AI Response: %.200s%s", ai_response, "..." if len(ai_response) > 200 else "")
+            else:
+                logger.error("❌ Failed: %d", response.status_code)
+        except requests.RequestException as e:
+            logger.error("💥 Error: %s", e)
+    
+    print(f"\n✅ {len(futures)} parallel sessions completed in {elapsed:.2f}s")
+
 if __name__ == "__main__":
     # Test single message
     result = test_vaanga_pesalam()
@@ -167,6 +223,10 @@ if __name__ == "__main__":
     # Test conversation flow if single message worked
     if 'error' not in result:
         test_conversation_flow()
+        
+        # PARALLEL_SESSIONS=1 adds the concurrent throughput check
+        if os.environ.get("PARALLEL_SESSIONS") == "1":
+            test_parallel_sessions()
     else:
         print("\n⚠️  Skipping conversation flow test due to single message failure")
     
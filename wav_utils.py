@@ -0,0 +1,47 @@
+"""
+Shared WAV helpers for the test scripts (mono 16-bit PCM)
+"""
+
+import struct
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+# RIFF chunk, fmt chunk, data chunk header
+WAV_HEADER_FMT = '<4sI4s4sIHHIIHH4sI'
+WAV_HEADER_SIZE = struct.calcsize(WAV_HEADER_FMT)
+
+
+@lru_cache(maxsize=8)
+def wav_header(n_samples: int, sample_rate: int) -> bytes:
+    """Build the fixed 44-byte header for n_samples of mono 16-bit PCM (shared per clip shape)"""
+    data_size = n_samples * 2
+    return struct.pack(WAV_HEADER_FMT,
+        b'RIFF',
+        36 + data_size,  # File size
+        b'WAVE',
+        b'fmt ',
+        16,  # PCM format chunk size
+        1,   # PCM format
+        1,   # Mono
+        sample_rate,
+        sample_rate * 2,  # Byte rate
+        2,   # Block align
+        16,  # Bits per sample
+        b'data',
+        data_size
+    )
+
+
+def new_wav_buffer(n_samples: int, sample_rate: int) -> Tuple[bytearray, np.ndarray]:
+    """
+    Allocate an exact-size WAV with its header filled in
+    
+    Returns the buffer and a writable int16 view of its data section, so
+    samples can be cast straight into place without a tobytes() copy.
+    """
+    wav = bytearray(WAV_HEADER_SIZE + n_samples * 2)
+    wav[:WAV_HEADER_SIZE] = wav_header(n_samples, sample_rate)
+    pcm = np.frombuffer(wav, dtype='<i2', offset=WAV_HEADER_SIZE)
+    return wav, pcm